@@ -1,27 +1,109 @@
 from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+import logging
 import os
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 
-# Load .env file if it exists
-load_dotenv()
+logger = logging.getLogger(__name__)
 
+_DOTENV_LOADED = False
 
-@dataclass
+
+def _ensure_dotenv() -> None:
+    """Load the .env file once; skip parsing entirely when there is none"""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
+    path = find_dotenv()
+    if path:
+        load_dotenv(path, override=False)
+
+
+# Other modules still read os.getenv directly, so populate the environment at import
+_ensure_dotenv()
+
+
+def _as_bool(raw: str) -> bool:
+    return raw.lower() == "true"
+
+
+# Settings that tolerate a malformed value by falling back to their default;
+# any other malformed numeric setting fails startup
+_LENIENT = {"VARDIFF_TARGET_SHARE_TIME", "VARDIFF_CHAIN_HEADROOM"}
+
+
+def _cast(key: str, raw: Optional[str], cast: Callable[[str], Any], default: Any) -> Any:
+    """Convert a raw environment value, using default when unset"""
+    if raw is None:
+        return default
+    try:
+        return cast(raw)
+    except ValueError as e:
+        if key not in _LENIENT:
+            raise ValueError(f"Invalid value for {key}: {raw!r}") from e
+        logger.warning(f"Ignoring invalid {key}={raw!r}, using default {default!r}")
+        return default
+
+
+# (attribute, environment variable, cast, default) - parsed in one pass by from_env()
+_SCHEMA = (
+    ("port", "STRATUM_PORT", int, 54321),
+    ("rpcport", "RXD_RPC_PORT", int, 7332),
+    ("rpcuser", "RXD_RPC_USER", str, ""),
+    ("rpcpass", "RXD_RPC_PASS", str, ""),
+    ("proxy_signature", "PROXY_SIGNATURE", str, "/radiant-stratum-proxy/"),
+    ("testnet", "TESTNET", _as_bool, False),
+    ("jobs", "SHOW_JOBS", _as_bool, False),
+    ("enable_zmq", "ENABLE_ZMQ", _as_bool, True),
+    # Static share difficulty (used when VarDiff is disabled)
+    # GPU default: 1.0, ASIC default: 512.0
+    ("static_share_difficulty", "STATIC_SHARE_DIFFICULTY", float, 1.0),
+    # Notification settings
+    ("discord_webhook", "DISCORD_WEBHOOK_URL", str, ""),
+    ("telegram_bot_token", "TELEGRAM_BOT_TOKEN", str, ""),
+    ("telegram_chat_id", "TELEGRAM_CHAT_ID", str, ""),
+    # Dashboard settings
+    ("enable_dashboard", "ENABLE_DASHBOARD", _as_bool, False),
+    ("dashboard_port", "DASHBOARD_PORT", int, 8080),
+    ("enable_database", "ENABLE_DATABASE", _as_bool, False),
+    # VarDiff settings - defaults tuned for GPU/ASIC mining
+    ("enable_vardiff", "ENABLE_VARDIFF", _as_bool, False),
+    ("vardiff_target_interval", "VARDIFF_TARGET_SHARE_TIME", float, 15.0),
+    ("vardiff_min_difficulty", "VARDIFF_MIN_DIFFICULTY", float, 100.0),
+    ("vardiff_max_difficulty", "VARDIFF_MAX_DIFFICULTY", float, 10000000.0),
+    # Starting difficulty for new miners (defaults to 1000 for faster convergence)
+    ("vardiff_start_difficulty", "VARDIFF_START_DIFFICULTY", float, 1000.0),
+    ("vardiff_retarget_shares", "VARDIFF_RETARGET_SHARES", int, 20),
+    ("vardiff_retarget_time", "VARDIFF_RETARGET_TIME", float, 300.0),
+    ("vardiff_up_step", "VARDIFF_UP_STEP", float, 2.0),
+    ("vardiff_down_step", "VARDIFF_DOWN_STEP", float, 0.5),
+    ("vardiff_ema_alpha", "VARDIFF_EMA_ALPHA", float, 0.3),
+    ("vardiff_inactivity_lower", "VARDIFF_INACTIVITY_LOWER", float, 90.0),
+    ("vardiff_inactivity_multiples", "VARDIFF_INACTIVITY_MULTIPLES", float, 6.0),
+    ("vardiff_inactivity_drop_factor", "VARDIFF_INACTIVITY_DROP_FACTOR", float, 0.5),
+    ("vardiff_state_path", "VARDIFF_STATE_PATH", str, "data/vardiff_state.json"),
+    ("vardiff_warm_start_minutes", "VARDIFF_WARM_START_MINUTES", int, 60),
+    ("vardiff_chain_headroom", "VARDIFF_CHAIN_HEADROOM", float, 0.9),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
-    # Initialize with None to force reading from environment in __post_init__
+    # Defaults mirror the environment fallbacks applied in from_env()
     ip: str = "0.0.0.0"
-    port: int = 0
-    rpcip: str = ""
-    rpcport: int = 0
+    port: int = 54321
+    rpcip: str = "radiant"
+    rpcport: int = 7332
     rpcuser: str = ""
     rpcpass: str = ""
-    proxy_signature: str = ""
+    proxy_signature: str = "/radiant-stratum-proxy/"
     testnet: bool = False
     jobs: bool = False
     log_level: str = "INFO"
     verbose: bool = False  # Deprecated: use log_level instead
-    enable_zmq: bool = False
-    rxd_zmq_endpoint: str = ""
+    enable_zmq: bool = True
+    rxd_zmq_endpoint: str = "tcp://radiant:29332"
     static_share_difficulty: float = 1.0
     discord_webhook: str = ""
     telegram_bot_token: str = ""
@@ -35,7 +117,7 @@ class Settings:
     # Adjusted defaults for RXD GPU/ASIC mining (SHA512/256d)
     vardiff_min_difficulty: float = 100.0       # Prevents share spam
     vardiff_max_difficulty: float = 10000000.0  # 10M for large ASIC farms
-    vardiff_start_difficulty: float = 10000.0   # Good starting point for GPUs
+    vardiff_start_difficulty: float = 1000.0
     vardiff_retarget_shares: int = 20
     vardiff_retarget_time: float = 300.0
     vardiff_up_step: float = 2.0
@@ -50,99 +132,58 @@ class Settings:
         0.9  # fraction of chain difficulty used as upper cap
     )
 
-    def __post_init__(self):
-        """Load settings from environment variables at instance creation time"""
-        self.port = int(os.getenv("STRATUM_PORT", "54321"))
-        self.rpcip = os.getenv("RXD_RPC_HOST", os.getenv("RXD_RPC_IP", "radiant"))
-        self.rpcport = int(os.getenv("RXD_RPC_PORT", "7332"))
-        self.rpcuser = os.getenv("RXD_RPC_USER", "")
-        self.rpcpass = os.getenv("RXD_RPC_PASS", "")
-        self.proxy_signature = os.getenv("PROXY_SIGNATURE", "/radiant-stratum-proxy/")
-        self.testnet = os.getenv("TESTNET", "false").lower() == "true"
-        self.jobs = os.getenv("SHOW_JOBS", "false").lower() == "true"
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Build settings from environment variables (or a snapshot mapping)"""
+        if env is None:
+            _ensure_dotenv()
+            env = os.environ
+        values = {
+            attr: _cast(key, env.get(key), cast, default)
+            for attr, key, cast, default in _SCHEMA
+        }
+        values["rpcip"] = env.get("RXD_RPC_HOST", env.get("RXD_RPC_IP", "radiant"))
 
         # Log level configuration (LOG_LEVEL takes precedence over VERBOSE)
-        log_level_env = os.getenv("LOG_LEVEL", "").upper()
+        log_level_env = env.get("LOG_LEVEL", "").upper()
         if log_level_env:
-            self.log_level = log_level_env
+            values["log_level"] = log_level_env
         else:
             # Fallback: check VERBOSE for backwards compatibility
-            self.verbose = os.getenv("VERBOSE", "false").lower() == "true"
-            self.log_level = "DEBUG" if self.verbose else "INFO"
+            values["verbose"] = _cast("VERBOSE", env.get("VERBOSE"), _as_bool, False)
+            values["log_level"] = "DEBUG" if values["verbose"] else "INFO"
 
-        # ZMQ Configuration - read at instance creation time
-        self.enable_zmq = os.getenv("ENABLE_ZMQ", "true").lower() == "true"
         # Auto-select ZMQ port based on network if not explicitly set
-        zmq_endpoint_env = os.getenv("RXD_ZMQ_ENDPOINT", "")
+        zmq_endpoint_env = env.get("RXD_ZMQ_ENDPOINT", "")
         if zmq_endpoint_env:
-            self.rxd_zmq_endpoint = zmq_endpoint_env
+            values["rxd_zmq_endpoint"] = zmq_endpoint_env
         else:
             # Use testnet port (39332) or mainnet port (29332) based on TESTNET setting
-            default_zmq_port = "39332" if self.testnet else "29332"
-            self.rxd_zmq_endpoint = f"tcp://radiant:{default_zmq_port}"
-        # Static share difficulty (used when VarDiff is disabled)
-        # This is the exact difficulty value miners will use
-        # GPU default: 1.0, ASIC default: 512.0
-        self.static_share_difficulty = float(
-            os.getenv("STATIC_SHARE_DIFFICULTY", "1.0")
-        )
-        # Notification settings
-        self.discord_webhook = os.getenv("DISCORD_WEBHOOK_URL", "")
-        self.telegram_bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
-        self.telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
-        # Dashboard settings
-        self.enable_dashboard = os.getenv("ENABLE_DASHBOARD", "false").lower() == "true"
-        self.dashboard_port = int(os.getenv("DASHBOARD_PORT", "8080"))
-        self.enable_database = os.getenv("ENABLE_DATABASE", "false").lower() == "true"
-        # VarDiff settings
-        self.enable_vardiff = os.getenv("ENABLE_VARDIFF", "false").lower() == "true"
-        try:
-            self.vardiff_target_interval = float(
-                os.getenv("VARDIFF_TARGET_SHARE_TIME", "15.0")
-            )
-        except ValueError:
-            self.vardiff_target_interval = 15.0
-        # Extended vardiff tunables - defaults tuned for GPU/ASIC mining
-        self.vardiff_min_difficulty = float(
-            os.getenv("VARDIFF_MIN_DIFFICULTY", "100.0")
-        )
-        self.vardiff_max_difficulty = float(os.getenv("VARDIFF_MAX_DIFFICULTY", "10000000.0"))
-        self.vardiff_start_difficulty = float(
-            os.getenv("VARDIFF_START_DIFFICULTY", "10000.0")
-        )
-        self.vardiff_retarget_shares = int(os.getenv("VARDIFF_RETARGET_SHARES", "20"))
-        self.vardiff_retarget_time = float(os.getenv("VARDIFF_RETARGET_TIME", "300.0"))
-        self.vardiff_up_step = float(os.getenv("VARDIFF_UP_STEP", "2.0"))
-        self.vardiff_down_step = float(os.getenv("VARDIFF_DOWN_STEP", "0.5"))
-        self.vardiff_ema_alpha = float(os.getenv("VARDIFF_EMA_ALPHA", "0.3"))
-        self.vardiff_inactivity_lower = float(
-            os.getenv("VARDIFF_INACTIVITY_LOWER", "90.0")
-        )
-        self.vardiff_inactivity_multiples = float(
-            os.getenv("VARDIFF_INACTIVITY_MULTIPLES", "6.0")
-        )
-        self.vardiff_inactivity_drop_factor = float(
-            os.getenv("VARDIFF_INACTIVITY_DROP_FACTOR", "0.5")
-        )
-        # Starting difficulty for new miners (defaults to 1000 for faster convergence)
-        self.vardiff_start_difficulty = float(
-            os.getenv("VARDIFF_START_DIFFICULTY", "1000.0")
-        )
-        self.vardiff_state_path = os.getenv(
-            "VARDIFF_STATE_PATH", "data/vardiff_state.json"
-        )
-        self.vardiff_warm_start_minutes = int(
-            os.getenv("VARDIFF_WARM_START_MINUTES", "60")
-        )
-        try:
-            self.vardiff_chain_headroom = float(
-                os.getenv("VARDIFF_CHAIN_HEADROOM", "0.9")
-            )
-            if self.vardiff_chain_headroom <= 0 or self.vardiff_chain_headroom > 1:
-                self.vardiff_chain_headroom = 0.9
-        except ValueError:
-            self.vardiff_chain_headroom = 0.9
+            default_zmq_port = "39332" if values["testnet"] else "29332"
+            values["rxd_zmq_endpoint"] = f"tcp://radiant:{default_zmq_port}"
+
+        # Fraction of chain difficulty must stay within (0, 1]
+        if not 0 < values["vardiff_chain_headroom"] <= 1:
+            values["vardiff_chain_headroom"] = 0.9
+        return cls(**values)
 
     @property
     def node_url(self) -> str:
         return f"http://{self.rpcuser}:{self.rpcpass}@{self.rpcip}:{self.rpcport}"
+
+
+_SETTINGS: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (environment is parsed once)"""
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings.from_env()
+    return _SETTINGS
+
+
+def set_settings(settings: Settings) -> None:
+    """Install `settings` (e.g. with CLI overrides) as the process-wide instance"""
+    global _SETTINGS
+    _SETTINGS = settings
@@ -1,10 +1,23 @@
 from typing import List, Tuple
+from functools import lru_cache
 import logging
+import struct
 from ..utils.enc import var_int, op_push
 from ..utils.hashers import dsha256
 
 logger = logging.getLogger(__name__)
 
+# Constant coinbase fragments, allocated once at import
+_PREVOUT_NULL = bytes(32)
+_SEQ_FINAL = b"\xff" * 4
+_LOCKTIME0 = bytes(4)
+_P2PKH_PREFIX = b"\x76\xa9\x14"  # OP_DUP OP_HASH160 <push 20>
+_P2PKH_SUFFIX = b"\x88\xac"  # OP_EQUALVERIFY OP_CHECKSIG
+
+# Fixed-width little-endian packers (variable-width BIP34 height still uses int.to_bytes)
+_U32LE = struct.Struct("<I").pack
+_U64LE = struct.Struct("<Q").pack
+
 
 def encode_height_bip34(height: int) -> bytes:
     """
@@ -22,22 +35,30 @@ def encode_height_bip34(height: int) -> bytes:
         return bytes([0x50 + height])  # OP_N encoding
     else:
         # For heights > 16, use the serialized script number format
-        # Serialize as little-endian, handling sign bit
+        # Serialize as little-endian, handling sign bit. The +8 reserves an
+        # extra byte whenever the top bit of the magnitude is set.
         neg = height < 0
         absvalue = -height if neg else height
-        result = bytearray()
-        while absvalue:
-            result.append(absvalue & 0xff)
-            absvalue >>= 8
-        # Handle sign bit
-        if result[-1] & 0x80:
-            result.append(0x80 if neg else 0)
-        elif neg:
+        result = bytearray(absvalue.to_bytes((absvalue.bit_length() + 8) // 8, "little"))
+        if neg:
             result[-1] |= 0x80
         # Add push opcode for the length
         return op_push(len(result)) + bytes(result)
 
 
+@lru_cache(maxsize=16)
+def _miner_script(pub_h160: bytes) -> bytes:
+    """P2PKH: OP_DUP OP_HASH160 <20-byte-hash> OP_EQUALVERIFY OP_CHECKSIG"""
+    return _P2PKH_PREFIX + pub_h160 + _P2PKH_SUFFIX
+
+
+@lru_cache(maxsize=16)
+def _miner_script_pushed(pub_h160: bytes) -> bytes:
+    """Miner output script with its length push prefix (payout address rarely changes)."""
+    script = _miner_script(pub_h160)
+    return op_push(len(script)) + script
+
+
 def build_coinbase(
     pub_h160: bytes,
     height: int,
@@ -67,61 +88,42 @@ def build_coinbase(
         len(coinbase_script_without_extranonces) + extranonce_placeholder_size
     )
 
-    coinbase_txin_start = (
-        bytes(32)
-        + b"\xff" * 4
-        + var_int(total_script_length)
-        + coinbase_script_without_extranonces
-    )
-    coinbase_txin_end = b"\xff" * 4
-
-    # Build miner output - P2PKH for Radiant addresses
-    # P2PKH: OP_DUP OP_HASH160 <20-byte-hash> OP_EQUALVERIFY OP_CHECKSIG
-    vout_to_miner = b"\x76\xa9\x14" + pub_h160 + b"\x88\xac"
-
-    outputs = [
-        miner_value.to_bytes(8, "little") + op_push(len(vout_to_miner)) + vout_to_miner
-    ]
+    # Build miner output - P2PKH for Radiant addresses (cached per payout address)
+    outputs = [_U64LE(miner_value) + _miner_script_pushed(pub_h160)]
 
     # Add extra outputs (e.g., miner fund)
     for sat, script in outputs_extra:
-        outputs.append(sat.to_bytes(8, "little") + op_push(len(script)) + script)
-
-    num_outputs = len(outputs)
-    coinbase_txin = coinbase_txin_start + coinbase_txin_end
+        outputs.append(_U64LE(sat) + op_push(len(script)) + script)
 
     # Radiant uses version 1 or 2 for transactions (standard Bitcoin format)
     tx_version = 1
-    
-    # Full coinbase transaction (no witness data for Radiant)
-    coinbase_tx = (
-        tx_version.to_bytes(4, "little")
-        + b"\x01"  # 1 input
-        + coinbase_txin
-        + var_int(num_outputs)
-        + b"".join(outputs)
-        + bytes(4)  # locktime
-    )
 
-    # Split for stratum protocol
-    coinbase1 = tx_version.to_bytes(4, "little") + b"\x01" + coinbase_txin_start
-    coinbase2 = (
-        coinbase_txin_end + var_int(num_outputs) + b"".join(outputs) + bytes(4)
+    # Split for stratum protocol; each part is joined into a single allocation
+    coinbase1 = b"".join(
+        [
+            _U32LE(tx_version),
+            b"\x01",  # 1 input
+            _PREVOUT_NULL,  # null prevout hash
+            _SEQ_FINAL,  # prevout index 0xffffffff
+            var_int(total_script_length),
+            coinbase_script_without_extranonces,
+        ]
+    )
+    coinbase2 = b"".join(
+        [
+            _SEQ_FINAL,  # coinbase input sequence
+            var_int(len(outputs)),
+            *outputs,
+            _LOCKTIME0,  # locktime
+        ]
     )
 
-    # For Radiant, coinbase1_nowit and coinbase2_nowit are the same as coinbase1 and coinbase2
-    # since there's no witness data
-    coinbase1_nowit = coinbase1
-    coinbase2_nowit = coinbase2
+    # Full coinbase transaction (no witness data for Radiant)
+    coinbase_tx = coinbase1 + coinbase2
 
     # Calculate txid using double SHA256
     coinbase_txid = dsha256(coinbase_tx)
 
-    return (
-        coinbase_tx,
-        coinbase_txid,
-        coinbase1,
-        coinbase2,
-        coinbase1_nowit,
-        coinbase2_nowit,
-    )
+    # Radiant has no witness data, so coinbase1/coinbase2 double as the
+    # "nowit" parts; callers reuse the same objects for both.
+    return coinbase_tx, coinbase_txid, coinbase1, coinbase2
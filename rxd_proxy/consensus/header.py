@@ -1,3 +1,9 @@
+import struct
+
+# Bound once: Struct.pack reuses the compiled format on every header build
+_U32LE = struct.Struct("<I").pack
+
+
 def build_header80_le(
     version: int,
     prevhash_le: bytes,
@@ -7,7 +13,7 @@ def build_header80_le(
     nonce_le: bytes,
 ) -> bytes:
     return (
-        version.to_bytes(4, "little")
+        _U32LE(version)
         + prevhash_le
         + merkleroot_le
         + ntime_le
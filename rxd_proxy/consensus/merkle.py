@@ -1,41 +1,29 @@
 from typing import List
-from ..utils.hashers import dsha256
+from ..utils.hashers import dsha256_pair, sha256d_level
 
 
-def merkle_root_from_txids_le(txids: List[bytes]) -> bytes:
-    if not txids:
-        return dsha256(b"")
-    if len(txids) == 1:
-        return txids[0]
-    level = txids[:]
-    while len(level) > 1:
-        if len(level) & 1:
-            level.append(level[-1])
-        level = [dsha256(level[i] + level[i + 1]) for i in range(0, len(level), 2)]
-    return level[0]
+def _next_level(buf: bytes) -> bytes:
+    """Hash one merkle level held as contiguous 32-byte rows into the next level."""
+    if len(buf) & 32:  # odd row count: duplicate the last row
+        buf += buf[-32:]
+    return b"".join(sha256d_level(buf))
 
 
-def merkle_branch_for_index0(txids: List[bytes]) -> List[bytes]:
-    if len(txids) <= 1:
-        return []
+def merkle_branch0_from_rows(level: bytes) -> List[bytes]:
+    """Index-0 merkle branch for LE txids packed as contiguous 32-byte rows."""
     branch = []
-    idx = 0
-    level = txids[:]
-    while len(level) > 1:
-        if len(level) & 1:
-            level.append(level[-1])
-        pair = idx ^ 1
-        branch.append(level[pair])
-        next_level = []
-        for i in range(0, len(level), 2):
-            next_level.append(dsha256(level[i] + level[i + 1]))
-        level = next_level
-        idx //= 2
+    while len(level) > 32:
+        # Index 0 always pairs with the second row of each level
+        branch.append(level[32:64])
+        if len(level) == 64:
+            break  # the next level is the root, which the branch never needs
+        level = _next_level(level)
     return branch
 
 
 def fold_branch_index0(leaf_le: bytes, branch: List[bytes]) -> bytes:
+    _h = dsha256_pair
     h = leaf_le
     for sib in branch:
-        h = dsha256(h + sib)
+        h = _h(h, sib)
     return h
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 # Radiant blockchain PoW limits
 # Note: Radiant uses SHA512/256d algorithm
 POW_LIMIT = int(
@@ -8,8 +10,10 @@ POW_LIMIT = int(
 DIFF1_TARGET = int(
     "00000000ffff0000000000000000000000000000000000000000000000000000", 16
 )
+_DIFF1_F = float(DIFF1_TARGET)
 
 
+@lru_cache(maxsize=128)
 def bits_to_target(bits_hex: str) -> int:
     """Convert compact bits representation to full target value."""
     bits = int(bits_hex, 16)
@@ -27,8 +31,15 @@ def normalize_be_hex(h: str) -> str:
     return h.lower().zfill(64)
 
 
+@lru_cache(maxsize=128)
 def target_to_diff1(target_int: int) -> float:
     """Convert a target value to difficulty (diff1-based)."""
     if target_int == 0:
         return float("inf")
-    return DIFF1_TARGET / target_int
+    return _DIFF1_F / float(target_int)
+
+
+@lru_cache(maxsize=128)
+def target_hex_to_diff1(target_hex: str) -> float:
+    """Convert a BE hex target (as getblocktemplate reports it) to difficulty (diff1-based)."""
+    return target_to_diff1(int(target_hex, 16))
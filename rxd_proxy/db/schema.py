@@ -1,21 +1,274 @@
 """Database schema for solo mining statistics"""
 
 import aiosqlite
+import asyncio
+import json
 import logging
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger("Database")
 
 DB_PATH = Path("./data/mining.db")
 
+# Bits of shares.flags
+SHARE_ACCEPTED = 1
+SHARE_BLOCK = 2
+
+
+async def _apply_pragmas(db: aiosqlite.Connection):
+    """Apply per-connection tuning (journal_mode=WAL is persisted by init_database)"""
+    await db.execute("PRAGMA synchronous=NORMAL")
+    await db.execute("PRAGMA temp_store=MEMORY")
+    await db.execute("PRAGMA mmap_size=268435456")
+    await db.execute("PRAGMA cache_size=-64000")
+    await db.execute("PRAGMA wal_autocheckpoint=1000")
+    await db.execute("PRAGMA busy_timeout=5000")
+
+
+# sqlite3 caches prepared statements per connection keyed by the SQL text; the
+# helpers' queries are fixed strings, so a larger cache keeps them all parsed
+_STATEMENT_CACHE_SIZE = 256
+
+# One long-lived connection shared by every helper keeps SQLite's page cache
+# warm; the lock serializes write transactions since they share that connection
+_db: Optional[aiosqlite.Connection] = None
+_connect_lock = asyncio.Lock()
+_write_lock = asyncio.Lock()
+
+# Dashboard getters draw from a few read-only connections so WAL can serve
+# them concurrently instead of queueing behind the writer's thread
+_READ_POOL_SIZE = 4
+_read_pool: Optional[asyncio.Queue] = None
+_read_conns: list[aiosqlite.Connection] = []
+
+
+async def _open_db():
+    """Open the shared connection, creating the file if needed (init_database only)"""
+    global _db
+    async with _connect_lock:
+        if _db is None:
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            db = await aiosqlite.connect(
+                DB_PATH, cached_statements=_STATEMENT_CACHE_SIZE
+            )
+            await _apply_pragmas(db)
+            db.row_factory = aiosqlite.Row
+            _db = db
+
+
+async def _get_db() -> aiosqlite.Connection:
+    """Return the shared connection opened by init_database"""
+    # Opening lazily would leave a schema-less mining.db behind when the
+    # database is disabled, so helpers fail until init_database has run
+    if _db is None:
+        raise RuntimeError("Database not initialized")
+    return _db
+
+
+@asynccontextmanager
+async def _write_conn():
+    """Shared connection with the write lock held; rolls back on error"""
+    db = await _get_db()
+    async with _write_lock:
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+
+
+async def _get_read_pool() -> asyncio.Queue:
+    """Return the read-only connection pool, opening it on first use"""
+    global _read_pool
+    if _read_pool is None:
+        # The database file must exist (init_database) before opening it read-only
+        await _get_db()
+        async with _connect_lock:
+            if _read_pool is None:
+                uri = DB_PATH.resolve().as_uri() + "?mode=ro"
+                pool: asyncio.Queue = asyncio.Queue()
+                for _ in range(_READ_POOL_SIZE):
+                    conn = await aiosqlite.connect(
+                        uri, uri=True, cached_statements=_STATEMENT_CACHE_SIZE
+                    )
+                    await _apply_pragmas(conn)
+                    await conn.execute("PRAGMA query_only=ON")
+                    conn.row_factory = aiosqlite.Row
+                    _read_conns.append(conn)
+                    pool.put_nowait(conn)
+                _read_pool = pool
+    return _read_pool
+
+
+@asynccontextmanager
+async def _read_conn():
+    """Borrow a read-only connection from the pool"""
+    pool = await _get_read_pool()
+    conn = await pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put_nowait(conn)
+
+
+# High-rate inserts are queued and written in batches, one transaction per flush
+_FLUSH_INTERVAL = 0.1
+_FLUSH_MAX_ROWS = 500
+_BATCH_SQL = {
+    "connections": """
+        INSERT INTO connections (worker, miner_software, event_type, timestamp)
+        VALUES (?, ?, ?, ?)
+    """,
+    "difficulty_history": """
+        INSERT OR REPLACE INTO difficulty_history (chain, difficulty, timestamp)
+        VALUES (?, ?, ?)
+    """,
+    "hashrate_history": """
+        INSERT OR REPLACE INTO hashrate_history (hashrate_hs, timestamp)
+        VALUES (?, ?)
+    """,
+    "shares": """
+        INSERT INTO shares (
+            worker, share_difficulty, sent_difficulty, difficulty_ratio,
+            flags, rxd_difficulty, chain, miner_software, timestamp
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    # Insert the worker/minute row or fold this share into its counters
+    "share_stats": """
+        INSERT INTO share_stats
+        (worker, timestamp, shares_submitted, shares_accepted, shares_rejected, sum_difficulty)
+        VALUES (?, ?, 1, ?, ?, ?)
+        ON CONFLICT(worker, timestamp) DO UPDATE SET
+            shares_submitted = shares_submitted + 1,
+            shares_accepted = shares_accepted + excluded.shares_accepted,
+            shares_rejected = shares_rejected + excluded.shares_rejected,
+            sum_difficulty = sum_difficulty + excluded.sum_difficulty
+    """,
+}
+_write_queue: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+# Set once init_database has created the tables; until then (or when the
+# database is disabled) queued rows are dropped instead of failing to flush
+_db_ready = False
+
+
+def database_ready() -> bool:
+    """Whether init_database has completed, i.e. the database is enabled and usable"""
+    return _db_ready
+
+
+def _enqueue_write(table: str, params: tuple):
+    """Queue a row for the background flusher, starting it on first use"""
+    global _write_queue, _flusher_task
+    if not _db_ready:
+        return
+    if _write_queue is None:
+        _write_queue = asyncio.Queue()
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_flusher(_write_queue))
+    _write_queue.put_nowait((table, params))
+
+
+async def _flush(batch: list):
+    """Write a batch of queued rows grouped by table in a single transaction"""
+    grouped: dict[str, list] = {}
+    for table, params in batch:
+        grouped.setdefault(table, []).append(params)
+    try:
+        async with _write_conn() as db:
+            for table, rows in grouped.items():
+                await db.executemany(_BATCH_SQL[table], rows)
+            await db.commit()
+    except Exception as e:
+        logger.warning(
+            f"Batched write of {len(batch)} queued rows failed ({e}); retrying row by row"
+        )
+        await _flush_rows(batch)
+
+
+async def _flush_rows(batch: list):
+    """Write queued rows one transaction each so a bad row only loses itself"""
+    failed = 0
+    for table, params in batch:
+        try:
+            async with _write_conn() as db:
+                await db.execute(_BATCH_SQL[table], params)
+                await db.commit()
+        except Exception as e:
+            failed += 1
+            logger.debug(f"Dropping queued {table} row {params!r}: {e}")
+    if failed:
+        logger.error(f"Failed to write {failed} of {len(batch)} queued database rows")
+
+
+async def _flusher(queue: asyncio.Queue):
+    """Drain the write queue every _FLUSH_INTERVAL; a None item stops it"""
+    while True:
+        batch = [await queue.get()]
+        if batch[0] is not None:
+            await asyncio.sleep(_FLUSH_INTERVAL)
+        while len(batch) < _FLUSH_MAX_ROWS and not queue.empty():
+            batch.append(queue.get_nowait())
+        rows = [item for item in batch if item is not None]
+        if rows:
+            await _flush(rows)
+        if len(rows) != len(batch):
+            return
+
+
+async def close_database():
+    """Flush queued writes, then close the shared and pooled connections (call on shutdown)"""
+    global _db, _read_pool, _flusher_task, _db_ready
+    _db_ready = False
+    if _flusher_task is not None:
+        if not _flusher_task.done():
+            _write_queue.put_nowait(None)
+            await _flusher_task
+        _flusher_task = None
+    if _write_queue is not None and not _write_queue.empty():
+        rows = []
+        while not _write_queue.empty():
+            item = _write_queue.get_nowait()
+            if item is not None:
+                rows.append(item)
+        if rows:
+            await _flush(rows)
+    _read_pool = None
+    while _read_conns:
+        await _read_conns.pop().close()
+    if _db is not None:
+        db, _db = _db, None
+        try:
+            await db.execute("PRAGMA optimize")
+        except Exception as e:
+            logger.debug(f"PRAGMA optimize on close failed: {e}")
+        await db.close()
+
 
 async def init_database():
     """Initialize the SQLite database with required tables"""
+    global _db_ready
+
+    await _open_db()
+
+    async with _write_conn() as db:
+        # Return pages freed by retention deletes to the OS incrementally. The
+        # mode only applies to new files; existing ones need a one-time VACUUM.
+        cursor = await db.execute("PRAGMA auto_vacuum")
+        auto_vacuum = (await cursor.fetchone())[0]
+        if auto_vacuum != 2:
+            await db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            cursor = await db.execute("SELECT COUNT(*) FROM sqlite_master")
+            if (await cursor.fetchone())[0] > 0:
+                logger.info("Enabling incremental auto-vacuum (one-time VACUUM)...")
+                await db.execute("VACUUM")
 
-    # Ensure data directory exists
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # WAL lets dashboard reads proceed during inserts; the mode persists in the file
+        await db.execute("PRAGMA journal_mode=WAL")
 
-    async with aiosqlite.connect(DB_PATH) as db:
         # Blocks found table
         await db.execute(
             """
@@ -43,11 +296,73 @@ async def init_database():
 
         await db.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_blocks_chain 
-            ON blocks(chain)
+            CREATE INDEX IF NOT EXISTS idx_blocks_chain_ts
+            ON blocks(chain, timestamp DESC)
         """
         )
 
+        # Superseded by idx_blocks_chain_ts (its leading column covers chain lookups)
+        await db.execute("DROP INDEX IF EXISTS idx_blocks_chain")
+
+        # All-time accepted block counts per chain, kept current by triggers so
+        # the dashboard never has to scan the full blocks history
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='block_counts'"
+        )
+        backfill_block_counts = await cursor.fetchone() is None
+        await db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS block_counts (
+                chain TEXT PRIMARY KEY,
+                cnt INTEGER NOT NULL DEFAULT 0
+            )
+        """
+        )
+
+        await db.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS t_blocks_ai AFTER INSERT ON blocks
+            WHEN NEW.accepted = 1
+            BEGIN
+                INSERT INTO block_counts (chain, cnt) VALUES (NEW.chain, 1)
+                ON CONFLICT(chain) DO UPDATE SET cnt = cnt + 1;
+            END
+        """
+        )
+
+        await db.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS t_blocks_ad AFTER DELETE ON blocks
+            WHEN OLD.accepted = 1
+            BEGIN
+                UPDATE block_counts SET cnt = cnt - 1 WHERE chain = OLD.chain;
+            END
+        """
+        )
+
+        await db.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS t_blocks_au AFTER UPDATE OF accepted, chain ON blocks
+            BEGIN
+                UPDATE block_counts SET cnt = cnt - 1
+                WHERE chain = OLD.chain AND OLD.accepted = 1;
+                INSERT INTO block_counts (chain, cnt)
+                SELECT NEW.chain, 1 WHERE NEW.accepted = 1
+                ON CONFLICT(chain) DO UPDATE SET cnt = cnt + 1;
+            END
+        """
+        )
+
+        # Seed from existing history once, when the table is first created;
+        # the triggers keep it exact from then on
+        if backfill_block_counts:
+            await db.execute(
+                """
+                INSERT INTO block_counts (chain, cnt)
+                SELECT chain, COUNT(*) FROM blocks WHERE accepted = 1 GROUP BY chain
+            """
+            )
+
         # Share statistics (aggregated per minute to keep it light)
         await db.execute(
             """
@@ -58,11 +373,27 @@ async def init_database():
                 shares_submitted INTEGER DEFAULT 0,
                 shares_accepted INTEGER DEFAULT 0,
                 shares_rejected INTEGER DEFAULT 0,
-                avg_difficulty REAL
+                avg_difficulty REAL,
+                sum_difficulty REAL DEFAULT 0
             )
         """
         )
 
+        # avg_difficulty is now derived from sum_difficulty on read; older
+        # databases get the column added and seeded from their running averages
+        cursor = await db.execute("PRAGMA table_info(share_stats)")
+        share_stats_columns = {row[1] for row in await cursor.fetchall()}
+        if "sum_difficulty" not in share_stats_columns:
+            await db.execute(
+                "ALTER TABLE share_stats ADD COLUMN sum_difficulty REAL DEFAULT 0"
+            )
+            await db.execute(
+                """
+                UPDATE share_stats
+                SET sum_difficulty = COALESCE(avg_difficulty, 0) * shares_submitted
+            """
+            )
+
         await db.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_share_stats_timestamp 
@@ -70,6 +401,44 @@ async def init_database():
         """
         )
 
+        # One row per worker/minute. Before the unique index (needed for the
+        # upsert) is first built, fold any duplicates older versions raced in
+        # into their oldest row so no counts are lost
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='ux_share_stats_worker_ts'"
+        )
+        if await cursor.fetchone() is None:
+            await db.execute(
+                """
+                UPDATE share_stats SET
+                    shares_submitted = (SELECT SUM(d.shares_submitted) FROM share_stats d
+                        WHERE d.worker = share_stats.worker AND d.timestamp = share_stats.timestamp),
+                    shares_accepted = (SELECT SUM(d.shares_accepted) FROM share_stats d
+                        WHERE d.worker = share_stats.worker AND d.timestamp = share_stats.timestamp),
+                    shares_rejected = (SELECT SUM(d.shares_rejected) FROM share_stats d
+                        WHERE d.worker = share_stats.worker AND d.timestamp = share_stats.timestamp),
+                    sum_difficulty = (SELECT SUM(d.sum_difficulty) FROM share_stats d
+                        WHERE d.worker = share_stats.worker AND d.timestamp = share_stats.timestamp)
+                WHERE id IN (
+                    SELECT MIN(id) FROM share_stats
+                    GROUP BY worker, timestamp HAVING COUNT(*) > 1
+                )
+            """
+            )
+            await db.execute(
+                """
+                DELETE FROM share_stats WHERE id NOT IN (
+                    SELECT MIN(id) FROM share_stats GROUP BY worker, timestamp
+                )
+            """
+            )
+            await db.execute(
+                """
+                CREATE UNIQUE INDEX ux_share_stats_worker_ts
+                ON share_stats(worker, timestamp)
+            """
+            )
+
         # Best shares tracking (top performing shares for insights)
         await db.execute(
             """
@@ -121,42 +490,56 @@ async def init_database():
         """
         )
 
-        # Difficulty history (for network trend analysis)
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS difficulty_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chain TEXT NOT NULL,
-                difficulty REAL NOT NULL,
-                timestamp INTEGER NOT NULL
-            )
-        """
-        )
-
-        await db.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_difficulty_history_chain_timestamp
-            ON difficulty_history(chain, timestamp DESC)
-        """
-        )
-
-        # Hashrate history (for performance tracking)
+        # Supports the stale-connection join in cleanup_on_startup
         await db.execute(
             """
-            CREATE TABLE IF NOT EXISTS hashrate_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                hashrate_hs REAL NOT NULL,
-                timestamp INTEGER NOT NULL
-            )
+            CREATE INDEX IF NOT EXISTS idx_connections_worker_event_ts
+            ON connections(worker, event_type, timestamp DESC)
         """
         )
 
-        await db.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_hashrate_history_timestamp
-            ON hashrate_history(timestamp DESC)
-        """
-        )
+        # Difficulty and hashrate history (trend charts). Both are append-only
+        # series read by time range, so they are stored clustered on their
+        # (chain,) timestamp key as WITHOUT ROWID tables
+        history_tables = {
+            "difficulty_history": (
+                """
+                CREATE TABLE IF NOT EXISTS {name} (
+                    chain TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    difficulty REAL NOT NULL,
+                    PRIMARY KEY (chain, timestamp)
+                ) WITHOUT ROWID
+            """,
+                "chain, timestamp, difficulty",
+            ),
+            "hashrate_history": (
+                """
+                CREATE TABLE IF NOT EXISTS {name} (
+                    timestamp INTEGER PRIMARY KEY,
+                    hashrate_hs REAL NOT NULL
+                ) WITHOUT ROWID
+            """,
+                "timestamp, hashrate_hs",
+            ),
+        }
+        for table, (create_sql, columns) in history_tables.items():
+            # Older databases have rowid tables with an id column; rebuild
+            # them once (the latest sample wins where a key repeats)
+            cursor = await db.execute(f"PRAGMA table_info({table})")
+            if "id" in {row[1] for row in await cursor.fetchall()}:
+                logger.info(f"Migrating {table} to a WITHOUT ROWID table...")
+                await db.execute(f"DROP TABLE IF EXISTS {table}_new")
+                await db.execute(create_sql.format(name=f"{table}_new"))
+                await db.execute(
+                    f"""
+                    INSERT OR REPLACE INTO {table}_new ({columns})
+                    SELECT {columns} FROM {table} ORDER BY id
+                """
+                )
+                await db.execute(f"DROP TABLE {table}")
+                await db.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+            await db.execute(create_sql.format(name=table))
 
         # Miner sessions tracking (for last-seen monitoring)
         await db.execute(
@@ -179,31 +562,62 @@ async def init_database():
         """
         )
 
+        # Serves the connected/disconnected listings (and their keyset
+        # cursor) in last_seen order without a sort; supersedes the
+        # single-column is_connected index
         await db.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_miner_sessions_connected
-            ON miner_sessions(is_connected)
+            CREATE INDEX IF NOT EXISTS idx_ms_connected_lastseen_worker
+            ON miner_sessions(is_connected, last_seen DESC, worker_name DESC)
         """
         )
-
-        # All shares submission log (for live feed and audit trail)
-        await db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS shares (
+        await db.execute("DROP INDEX IF EXISTS idx_ms_connected_lastseen")
+        await db.execute("DROP INDEX IF EXISTS idx_miner_sessions_connected")
+
+        # All shares submission log (for live feed and audit trail). The
+        # accepted/is_block booleans are packed into one flags column
+        # (SHARE_ACCEPTED | SHARE_BLOCK) to keep rows on this table small.
+        shares_sql = """
+            CREATE TABLE IF NOT EXISTS {name} (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 worker TEXT NOT NULL,
                 share_difficulty REAL NOT NULL,
                 sent_difficulty REAL NOT NULL,
                 difficulty_ratio REAL NOT NULL,
-                is_block BOOLEAN NOT NULL DEFAULT 0,
-                accepted BOOLEAN NOT NULL DEFAULT 1,
+                flags INTEGER NOT NULL DEFAULT 1,
                 rxd_difficulty REAL NOT NULL,
                 chain TEXT,
                 miner_software TEXT,
                 timestamp INTEGER NOT NULL
             )
         """
-        )
+
+        # Older databases have separate is_block/accepted columns; rebuild
+        # the table once, keeping ids (its indexes are recreated below)
+        cursor = await db.execute("PRAGMA table_info(shares)")
+        shares_columns = {row[1] for row in await cursor.fetchall()}
+        if "is_block" in shares_columns:
+            logger.info("Migrating shares table to packed flags column...")
+            await db.execute("DROP TABLE IF EXISTS shares_new")
+            await db.execute(shares_sql.format(name="shares_new"))
+            await db.execute(
+                f"""
+                INSERT INTO shares_new (
+                    id, worker, share_difficulty, sent_difficulty, difficulty_ratio,
+                    flags, rxd_difficulty, chain, miner_software, timestamp
+                )
+                SELECT
+                    id, worker, share_difficulty, sent_difficulty, difficulty_ratio,
+                    (CASE WHEN accepted THEN {SHARE_ACCEPTED} ELSE 0 END)
+                        | (CASE WHEN is_block THEN {SHARE_BLOCK} ELSE 0 END),
+                    rxd_difficulty, chain, miner_software, timestamp
+                FROM shares
+            """
+            )
+            await db.execute("DROP TABLE shares")
+            await db.execute("ALTER TABLE shares_new RENAME TO shares")
+
+        await db.execute(shares_sql.format(name="shares"))
 
         await db.execute(
             """
@@ -219,17 +633,22 @@ async def init_database():
         """
         )
 
+        # Partial indexes on the rare cases dashboards filter for; full boolean
+        # indexes cost two extra B-tree writes per share for ~50% selectivity
+        await db.execute("DROP INDEX IF EXISTS idx_shares_is_block")
+        await db.execute("DROP INDEX IF EXISTS idx_shares_accepted")
+
         await db.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_shares_is_block 
-            ON shares(is_block, timestamp DESC)
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_shares_blocks
+            ON shares(timestamp DESC) WHERE (flags & {SHARE_BLOCK}) != 0
         """
         )
 
         await db.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_shares_accepted 
-            ON shares(accepted, timestamp DESC)
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_shares_rejected
+            ON shares(timestamp DESC) WHERE (flags & {SHARE_ACCEPTED}) = 0
         """
         )
 
@@ -254,12 +673,22 @@ async def init_database():
         """
         )
 
+        # Pending listings are ordered by submission time, the poller by
+        # last_check over pending rows only; these replace the old
+        # (chain, status, last_check) index
         await db.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_block_confirmations_status
-            ON block_confirmations(chain, status, last_check DESC)
+            CREATE INDEX IF NOT EXISTS idx_bc_chain_status_subts
+            ON block_confirmations(chain, status, submitted_timestamp DESC)
         """
         )
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_bc_status_pending
+            ON block_confirmations(chain, last_check) WHERE status = 'pending'
+        """
+        )
+        await db.execute("DROP INDEX IF EXISTS idx_block_confirmations_status")
 
         await db.execute(
             """
@@ -268,6 +697,35 @@ async def init_database():
         """
         )
 
+        # Covers the blocks LEFT JOIN probe and the confirmation columns it projects
+        await db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_bc_chain_hash
+            ON block_confirmations(chain, block_hash, confirmations, status, is_orphaned)
+        """
+        )
+
+        # Each block is tracked once; collapse duplicates the first time the
+        # unique index is built (afterwards it makes them impossible)
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='ux_bc_chain_height_hash'"
+        )
+        if await cursor.fetchone() is None:
+            await db.execute(
+                """
+                DELETE FROM block_confirmations WHERE id NOT IN (
+                    SELECT MIN(id) FROM block_confirmations
+                    GROUP BY chain, height, block_hash
+                )
+            """
+            )
+            await db.execute(
+                """
+                CREATE UNIQUE INDEX ux_bc_chain_height_hash
+                ON block_confirmations(chain, height, block_hash)
+            """
+            )
+
         # Database metadata table for tracking initialization state
         await db.execute(
             """
@@ -282,15 +740,23 @@ async def init_database():
         await db.commit()
         logger.info(f"Database initialized at {DB_PATH}")
 
-        # Perform startup cleanup
-        await cleanup_on_startup()
+    # Perform startup cleanup
+    await cleanup_on_startup()
+
+    # Give the query planner real statistics for the indexes created above
+    async with _write_conn() as db:
+        await db.execute("ANALYZE")
+        await db.commit()
+
+    _db_ready = True
 
 
 async def cleanup_on_startup():
     """Clean up database on startup - clear stale connections and old share stats"""
-    import time
+    # All startup maintenance, including confirmation seeding, is one transaction
+    async with _write_conn() as db:
+        await db.execute("BEGIN IMMEDIATE")
 
-    async with aiosqlite.connect(DB_PATH) as db:
         # Clear connection events from previous sessions
         # Keep only the last 7 days of connection history
         week_ago = int(time.time()) - (7 * 24 * 3600)
@@ -321,151 +787,126 @@ async def cleanup_on_startup():
 
         # Mark any "connected" entries without corresponding "disconnected" as stale
         # This handles cases where proxy was killed without clean disconnection
-        await db.execute(
+        cursor = await db.execute(
             """
             INSERT INTO connections (worker, miner_software, event_type, timestamp)
-            SELECT DISTINCT worker, miner_software, 'disconnected_cleanup', ?
+            SELECT DISTINCT c1.worker, c1.miner_software, 'disconnected_cleanup', ?
             FROM connections c1
-            WHERE c1.event_type = 'connected'
-            AND NOT EXISTS (
-                SELECT 1 FROM connections c2 
-                WHERE c2.worker = c1.worker 
-                AND c2.event_type = 'disconnected' 
+            LEFT JOIN connections c2
+                ON c2.worker = c1.worker
+                AND c2.event_type = 'disconnected'
                 AND c2.timestamp > c1.timestamp
-            )
+            WHERE c1.event_type = 'connected' AND c2.id IS NULL
             """,
             (int(time.time()),),
         )
 
-        cleanup_count = db.total_changes
+        cleanup_count = cursor.rowcount
         if cleanup_count > 0:
             logger.info(f"Marked {cleanup_count} stale connections as disconnected")
 
         # Clean up shares older than 30 days on startup
         thirty_days_ago = int(time.time()) - (30 * 24 * 3600)
-        await db.execute("DELETE FROM shares WHERE timestamp < ?", (thirty_days_ago,))
-        old_shares = db.total_changes
+        cursor = await db.execute(
+            "DELETE FROM shares WHERE timestamp < ?", (thirty_days_ago,)
+        )
+        old_shares = cursor.rowcount
         if old_shares > 0:
             logger.info(f"Cleaned up {old_shares} shares older than 30 days")
 
-        await db.commit()
-
         # Seed block_confirmations from existing blocks on startup
-        seeding_complete = await seed_block_confirmations_from_blocks()
+        seeding_complete = await seed_block_confirmations_from_blocks(db)
+
+        await db.commit()
 
-        # Mark seeding complete on the confirmation monitor if it exists
-        if seeding_complete:
-            try:
-                from ..web.block_confirmation_monitor import get_confirmation_monitor
+    # Mark seeding complete on the confirmation monitor if it exists
+    if seeding_complete:
+        try:
+            from ..web.block_confirmation_monitor import get_confirmation_monitor
 
-                monitor = get_confirmation_monitor()
-                if monitor:
-                    monitor.seeding_complete = True
-                    logger.debug("Marked confirmation monitor seeding as complete")
-            except Exception as e:
-                logger.debug(f"Could not mark monitor seeding complete: {e}")
+            monitor = get_confirmation_monitor()
+            if monitor:
+                monitor.seeding_complete = True
+                logger.debug("Marked confirmation monitor seeding as complete")
+        except Exception as e:
+            logger.debug(f"Could not mark monitor seeding complete: {e}")
 
 
-async def seed_block_confirmations_from_blocks():
+async def seed_block_confirmations_from_blocks(db: aiosqlite.Connection | None = None):
     """
     On startup, populate block_confirmations table from any existing blocks.
     This ensures we start tracking all previously found blocks.
     Only runs once per database - subsequent startups skip this.
+    When given a connection, runs inside the caller's transaction and leaves
+    the commit to it.
     Returns: True if seeding was performed, False if already seeded.
     """
-    import time
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if seeding has already been done
-        cursor = await db.execute(
-            "SELECT value FROM db_metadata WHERE key = 'block_confirmations_seeded'"
+    if db is None:
+        async with _write_conn() as db:
+            seeded = await seed_block_confirmations_from_blocks(db)
+            await db.commit()
+            return seeded
+
+    # Check if seeding has already been done
+    cursor = await db.execute(
+        "SELECT value FROM db_metadata WHERE key = 'block_confirmations_seeded'"
+    )
+    seeded_row = await cursor.fetchone()
+
+    if seeded_row:
+        logger.debug(
+            "Block confirmations already seeded, skipping (previously done at %s)",
+            seeded_row[0],
         )
-        seeded_row = await cursor.fetchone()
+        return False
 
-        if seeded_row:
-            logger.debug(
-                "Block confirmations already seeded, skipping (previously done at %s)",
-                seeded_row[0],
-            )
-            return False
+    current_time = int(time.time())
 
-        # Check if there are any blocks without confirmation tracking
-        cursor = await db.execute(
-            """
-            SELECT COUNT(*) FROM blocks b
-            WHERE NOT EXISTS (
-                SELECT 1 FROM block_confirmations bc
-                WHERE bc.chain = b.chain 
-                AND bc.height = b.height 
-                AND bc.block_hash = b.block_hash
-            )
+    # Insert all blocks that don't have confirmation tracking yet; the
+    # unique index skips the ones already tracked
+    cursor = await db.execute(
         """
-        )
-        count_row = await cursor.fetchone()
-        untracked = count_row[0] if count_row else 0
-
-        if untracked > 0:
-            logger.info(
-                f"Seeding {untracked} existing blocks into confirmation tracking"
-            )
-
-            current_time = int(time.time())
-
-            # Insert all blocks that don't have confirmation tracking yet
-            await db.execute(
-                """
-                INSERT INTO block_confirmations 
-                (chain, height, block_hash, worker, confirmations, status, 
-                 last_check, first_submitted, submitted_timestamp)
-                SELECT 
-                    b.chain,
-                    b.height,
-                    b.block_hash,
-                    b.worker,
-                    0,
-                    'pending',
-                    ?,
-                    b.timestamp,
-                    b.timestamp
-                FROM blocks b
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM block_confirmations bc
-                    WHERE bc.chain = b.chain 
-                    AND bc.height = b.height 
-                    AND bc.block_hash = b.block_hash
-                )
-            """,
-                (current_time,),
-            )
-
-            logger.info(
-                f"Successfully seeded {untracked} blocks for confirmation tracking"
-            )
-        else:
-            logger.debug("No untracked blocks to seed")
-
-        # Mark seeding as done (so we don't repeat on next startup)
-        await db.execute(
-            """
-            INSERT OR REPLACE INTO db_metadata (key, value, updated_at)
-            VALUES (?, ?, ?)
-            """,
-            ("block_confirmations_seeded", "true", int(time.time())),
-        )
+        INSERT OR IGNORE INTO block_confirmations 
+        (chain, height, block_hash, worker, confirmations, status, 
+         last_check, first_submitted, submitted_timestamp)
+        SELECT 
+            b.chain,
+            b.height,
+            b.block_hash,
+            b.worker,
+            0,
+            'pending',
+            ?,
+            b.timestamp,
+            b.timestamp
+        FROM blocks b
+    """,
+        (current_time,),
+    )
+    seeded = cursor.rowcount
+
+    if seeded > 0:
+        logger.info(f"Successfully seeded {seeded} blocks for confirmation tracking")
+    else:
+        logger.debug("No untracked blocks to seed")
+
+    # Mark seeding as done (so we don't repeat on next startup)
+    await db.execute(
+        """
+        INSERT OR REPLACE INTO db_metadata (key, value, updated_at)
+        VALUES (?, ?, ?)
+        """,
+        ("block_confirmations_seeded", "true", int(time.time())),
+    )
 
-        await db.commit()
-        logger.info(
-            "Block confirmations seeding completed (will not repeat on restart)"
-        )
+    logger.info("Block confirmations seeding completed (will not repeat on restart)")
 
-        return True
+    return True
 
 
 async def cleanup_old_data():
     """Periodic cleanup function - can be called regularly to maintain database size"""
-    import time
-
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_conn() as db:
         # Keep blocks indefinitely - they're rare and valuable
         # Keep connections for 7 days
         # Keep share stats for 24 hours
@@ -476,19 +917,34 @@ async def cleanup_old_data():
         thirty_days_ago = int(time.time()) - (30 * 24 * 3600)
 
         # Clean connections
-        await db.execute("DELETE FROM connections WHERE timestamp < ?", (week_ago,))
-        connections_cleaned = db.total_changes
+        cursor = await db.execute(
+            "DELETE FROM connections WHERE timestamp < ?", (week_ago,)
+        )
+        connections_cleaned = cursor.rowcount
 
         # Clean share stats
-        await db.execute("DELETE FROM share_stats WHERE timestamp < ?", (day_ago,))
-        shares_cleaned = db.total_changes
+        cursor = await db.execute(
+            "DELETE FROM share_stats WHERE timestamp < ?", (day_ago,)
+        )
+        shares_cleaned = cursor.rowcount
 
         # Clean old shares - keep 30 days of history
-        await db.execute("DELETE FROM shares WHERE timestamp < ?", (thirty_days_ago,))
-        old_shares_cleaned = db.total_changes
+        cursor = await db.execute(
+            "DELETE FROM shares WHERE timestamp < ?", (thirty_days_ago,)
+        )
+        old_shares_cleaned = cursor.rowcount
+
+        await db.commit()
 
+        # Release up to 1000 freed pages; the pragma frees one page per step,
+        # so the cursor has to be drained for it to run to completion
+        cursor = await db.execute("PRAGMA incremental_vacuum(1000)")
+        await cursor.fetchall()
         await db.commit()
 
+        # Refresh planner statistics if the deletes shifted them (cheap when not)
+        await db.execute("PRAGMA optimize")
+
         if connections_cleaned > 0 or shares_cleaned > 0 or old_shares_cleaned > 0:
             logger.info(
                 f"Periodic cleanup: {connections_cleaned} connections, {shares_cleaned} share stats, {old_shares_cleaned} old shares"
@@ -506,7 +962,9 @@ async def log_block_found(
     accepted: bool = True,
 ):
     """Log a block find to the database"""
-    async with aiosqlite.connect(DB_PATH) as db:
+    # Written immediately rather than queued: a block row must not share the
+    # fate of a batch, and the dashboard totals should reflect it right away
+    async with _write_conn() as db:
         await db.execute(
             """
             INSERT INTO blocks 
@@ -525,21 +983,14 @@ async def log_block_found(
             ),
         )
         await db.commit()
+    _stats_cache.clear()
 
 
 async def log_connection_event(
     worker: str, miner_software: str, event_type: str, timestamp: int
 ):
     """Log a miner connection/disconnection event"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """
-            INSERT INTO connections (worker, miner_software, event_type, timestamp)
-            VALUES (?, ?, ?, ?)
-        """,
-            (worker, miner_software, event_type, timestamp),
-        )
-        await db.commit()
+    _enqueue_write("connections", (worker, miner_software, event_type, timestamp))
 
 
 async def update_share_stats(
@@ -549,65 +1000,40 @@ async def update_share_stats(
     # Round timestamp to minute
     minute_timestamp = (timestamp // 60) * 60
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if entry exists for this worker/minute
-        cursor = await db.execute(
-            """
-            SELECT id, shares_submitted, shares_accepted, shares_rejected, avg_difficulty
-            FROM share_stats
-            WHERE worker = ? AND timestamp = ?
-        """,
-            (worker, minute_timestamp),
-        )
-
-        row = await cursor.fetchone()
-
-        if row:
-            # Update existing entry
-            row_id, submitted, acc, rej, avg_diff = row
-            new_submitted = submitted + 1
-            new_accepted = acc + (1 if accepted else 0)
-            new_rejected = rej + (0 if accepted else 1)
-            # Running average of difficulty
-            new_avg_diff = ((avg_diff * submitted) + difficulty) / new_submitted
-
-            await db.execute(
-                """
-                UPDATE share_stats
-                SET shares_submitted = ?,
-                    shares_accepted = ?,
-                    shares_rejected = ?,
-                    avg_difficulty = ?
-                WHERE id = ?
-            """,
-                (new_submitted, new_accepted, new_rejected, new_avg_diff, row_id),
-            )
-        else:
-            # Create new entry
-            await db.execute(
-                """
-                INSERT INTO share_stats 
-                (worker, timestamp, shares_submitted, shares_accepted, shares_rejected, avg_difficulty)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    worker,
-                    minute_timestamp,
-                    1,  # shares_submitted (always 1 for new entry)
-                    1 if accepted else 0,  # shares_accepted
-                    0 if accepted else 1,  # shares_rejected
-                    difficulty,  # avg_difficulty
-                ),
-            )
-
-        await db.commit()
-
+    _enqueue_write(
+        "share_stats",
+        (
+            worker,
+            minute_timestamp,
+            1 if accepted else 0,
+            0 if accepted else 1,
+            difficulty,
+        ),
+    )
+
+
+async def get_recent_blocks(
+    limit: int = 50,
+    offset: int = 0,
+    cursor_ts: int | None = None,
+    cursor_id: int | None = None,
+):
+    """Get recent blocks found with pagination support, including confirmation data
 
-async def get_recent_blocks(limit: int = 50, offset: int = 0):
-    """Get recent blocks found with pagination support, including confirmation data"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+    Pass the previous page's next_cursor values as cursor_ts and cursor_id for
+    keyset paging, which seeks straight to the page instead of scanning past
+    `offset` rows.
+    """
+    if cursor_ts is None:
+        page_filter, page_clause, page_params = "", "LIMIT ? OFFSET ?", (limit, offset)
+    else:
+        page_filter, page_clause, page_params = (
+            "WHERE (b.timestamp, b.id) < (?, ?)",
+            "LIMIT ?",
+            (cursor_ts, cursor_id or 0, limit),
+        )
 
+    async with _read_conn() as db:
         # Get total count
         count_cursor = await db.execute("SELECT COUNT(*) as total FROM blocks")
         count_row = await count_cursor.fetchone()
@@ -615,7 +1041,7 @@ async def get_recent_blocks(limit: int = 50, offset: int = 0):
 
         # Get paginated results with LEFT JOIN to confirmations
         cursor = await db.execute(
-            """
+            f"""
             SELECT 
                 b.*,
                 COALESCE(bc.confirmations, 0) as confirmations,
@@ -624,23 +1050,46 @@ async def get_recent_blocks(limit: int = 50, offset: int = 0):
             FROM blocks b
             LEFT JOIN block_confirmations bc 
                 ON b.chain = bc.chain AND b.block_hash = bc.block_hash
-            ORDER BY b.timestamp DESC
-            LIMIT ? OFFSET ?
+            {page_filter}
+            ORDER BY b.timestamp DESC, b.id DESC
+            {page_clause}
         """,
-            (limit, offset),
+            page_params,
         )
-        rows = await cursor.fetchall()
+        blocks = [dict(row) async for row in cursor]
         return {
-            "blocks": [dict(row) for row in rows],
+            "blocks": blocks,
             "total": total_count,
+            "next_cursor": (
+                {"timestamp": blocks[-1]["timestamp"], "id": blocks[-1]["id"]}
+                if blocks
+                else None
+            ),
         }
 
 
-async def get_blocks_by_chain(chain: str, limit: int = 10, offset: int = 0):
-    """Get recent blocks for a specific chain with pagination, including confirmation data"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def get_blocks_by_chain(
+    chain: str,
+    limit: int = 10,
+    offset: int = 0,
+    cursor_ts: int | None = None,
+    cursor_id: int | None = None,
+):
+    """Get recent blocks for a specific chain with pagination, including confirmation data
+
+    Pass the previous page's next_cursor values as cursor_ts and cursor_id
+    for keyset paging.
+    """
+    if cursor_ts is None:
+        page_filter, page_clause, page_params = "", "LIMIT ? OFFSET ?", (limit, offset)
+    else:
+        page_filter, page_clause, page_params = (
+            "AND (b.timestamp, b.id) < (?, ?)",
+            "LIMIT ?",
+            (cursor_ts, cursor_id or 0, limit),
+        )
 
+    async with _read_conn() as db:
         # Get total count for this chain
         count_cursor = await db.execute(
             "SELECT COUNT(*) as total FROM blocks WHERE chain = ?",
@@ -651,7 +1100,7 @@ async def get_blocks_by_chain(chain: str, limit: int = 10, offset: int = 0):
 
         # Get paginated results with LEFT JOIN to confirmations
         cursor = await db.execute(
-            """
+            f"""
             SELECT 
                 b.*,
                 COALESCE(bc.confirmations, 0) as confirmations,
@@ -660,23 +1109,132 @@ async def get_blocks_by_chain(chain: str, limit: int = 10, offset: int = 0):
             FROM blocks b
             LEFT JOIN block_confirmations bc 
                 ON b.chain = bc.chain AND b.block_hash = bc.block_hash
-            WHERE b.chain = ?
-            ORDER BY b.timestamp DESC
+            WHERE b.chain = ? {page_filter}
+            ORDER BY b.timestamp DESC, b.id DESC
+            {page_clause}
+        """,
+            (chain, *page_params),
+        )
+        blocks = [dict(row) async for row in cursor]
+        return {
+            "blocks": blocks,
+            "total": total,
+            "next_cursor": (
+                {"timestamp": blocks[-1]["timestamp"], "id": blocks[-1]["id"]}
+                if blocks
+                else None
+            ),
+        }
+
+
+async def log_share(
+    worker: str,
+    share_difficulty: float,
+    sent_difficulty: float,
+    difficulty_ratio: float,
+    is_block: bool,
+    accepted: bool,
+    rxd_difficulty: float,
+    chain: str | None,
+    miner_software: str | None,
+    timestamp: int,
+):
+    """Log a submitted share to the shares table (live feed history)"""
+    flags = (SHARE_ACCEPTED if accepted else 0) | (SHARE_BLOCK if is_block else 0)
+    _enqueue_write(
+        "shares",
+        (
+            worker,
+            share_difficulty,
+            sent_difficulty,
+            difficulty_ratio,
+            flags,
+            rxd_difficulty,
+            chain,
+            miner_software,
+            timestamp,
+        ),
+    )
+
+
+async def get_shares(
+    limit: int = 100,
+    offset: int = 0,
+    worker: str | None = None,
+    accepted_only: bool = False,
+    blocks_only: bool = False,
+):
+    """Get logged shares, newest first, with optional filters and the matching total"""
+    where = "WHERE 1=1"
+    params: list = []
+    if worker:
+        where += " AND worker = ?"
+        params.append(worker)
+    if accepted_only:
+        where += f" AND (flags & {SHARE_ACCEPTED}) != 0"
+    if blocks_only:
+        where += f" AND (flags & {SHARE_BLOCK}) != 0"
+
+    async with _read_conn() as db:
+        cursor = await db.execute(
+            f"""
+            SELECT id, worker, share_difficulty, sent_difficulty, difficulty_ratio,
+                (flags & {SHARE_BLOCK}) != 0 AS is_block,
+                (flags & {SHARE_ACCEPTED}) != 0 AS accepted,
+                rxd_difficulty, chain, miner_software, timestamp
+            FROM shares {where}
+            ORDER BY timestamp DESC
             LIMIT ? OFFSET ?
         """,
-            (chain, limit, offset),
+            (*params, limit, offset),
+        )
+        shares = [dict(row) async for row in cursor]
+
+        cursor = await db.execute(f"SELECT COUNT(*) FROM shares {where}", params)
+        row = await cursor.fetchone()
+        return {"shares": shares, "total": row[0] if row else 0}
+
+
+async def get_share_totals():
+    """Get all-time share counts from the shares table"""
+    async with _read_conn() as db:
+        cursor = await db.execute(
+            f"""
+            SELECT COUNT(*) AS total_shares,
+                SUM((flags & {SHARE_ACCEPTED}) != 0) AS accepted_shares,
+                SUM((flags & {SHARE_ACCEPTED}) = 0) AS rejected_shares,
+                SUM((flags & {SHARE_BLOCK}) != 0) AS blocks
+            FROM shares
+        """
         )
-        rows = await cursor.fetchall()
-        return {"blocks": [dict(row) for row in rows], "total": total}
+        row = await cursor.fetchone()
+        return {key: row[key] or 0 for key in row.keys()}
+
+
+async def get_block_time_span():
+    """Get the (oldest, newest) block timestamps, or (None, None) with no blocks"""
+    async with _read_conn() as db:
+        cursor = await db.execute("SELECT MIN(timestamp), MAX(timestamp) FROM blocks")
+        row = await cursor.fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+
+# get_stats_summary results per `hours`, reused for a few seconds because the
+# dashboard polls it far more often than the underlying aggregates change
+_STATS_CACHE_TTL = 5.0
+_stats_cache: dict[int, tuple[float, dict]] = {}
 
 
 async def get_stats_summary(hours: int = 24):
     """Get summary statistics for the dashboard"""
-    import time
+    cached = _stats_cache.get(hours)
+    if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+        # Callers add their own keys to the result, so hand out a copy
+        return dict(cached[1])
 
     cutoff = int(time.time()) - (hours * 3600)
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _read_conn() as db:
         # Total blocks found in period
         cursor = await db.execute(
             """
@@ -706,14 +1264,9 @@ async def get_stats_summary(hours: int = 24):
         total_shares = accepted + rejected
         acceptance_rate = (accepted / total_shares * 100) if total_shares > 0 else None
 
-        # All-time accepted blocks by chain (kept indefinitely)
+        # All-time accepted blocks by chain (maintained by the blocks triggers)
         cursor = await db.execute(
-            """
-            SELECT chain, COUNT(*) as count
-            FROM blocks
-            WHERE accepted = 1
-            GROUP BY chain
-        """
+            "SELECT chain, cnt FROM block_counts WHERE cnt > 0"
         )
         blocks_all_time_rows = await cursor.fetchall()
         blocks_all_time = {row[0]: row[1] for row in blocks_all_time_rows}
@@ -743,7 +1296,7 @@ async def get_stats_summary(hours: int = 24):
             result_row = await cursor.fetchone()
             shares_since_last_block = (result_row[0] or 0) if result_row else 0
 
-        return {
+        summary = {
             "blocks": blocks_by_chain,
             "total_blocks": sum(blocks_by_chain.values()),
             "acceptance_rate": acceptance_rate,
@@ -754,21 +1307,21 @@ async def get_stats_summary(hours: int = 24):
             "blocks_all_time": blocks_all_time,
             "total_blocks_all_time": sum(blocks_all_time.values()),
         }
+        _stats_cache[hours] = (time.monotonic(), summary)
+        return dict(summary)
 
 
 async def get_recent_share_stats(worker: str | None = None, minutes: int = 10):
     """Get recent share statistics for hashrate verification"""
-    import time
-
     cutoff = int(time.time()) - (minutes * 60)
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with _read_conn() as db:
         if worker:
             cursor = await db.execute(
                 """
-                SELECT * FROM share_stats
+                SELECT id, worker, timestamp, shares_submitted, shares_accepted, shares_rejected,
+                    sum_difficulty / NULLIF(shares_submitted, 0) AS avg_difficulty
+                FROM share_stats
                 WHERE worker = ? AND timestamp > ?
                 ORDER BY timestamp DESC
             """,
@@ -777,15 +1330,35 @@ async def get_recent_share_stats(worker: str | None = None, minutes: int = 10):
         else:
             cursor = await db.execute(
                 """
-                SELECT * FROM share_stats
+                SELECT id, worker, timestamp, shares_submitted, shares_accepted, shares_rejected,
+                    sum_difficulty / NULLIF(shares_submitted, 0) AS avg_difficulty
+                FROM share_stats
                 WHERE timestamp > ?
                 ORDER BY timestamp DESC
             """,
                 (cutoff,),
             )
 
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) async for row in cursor]
+
+
+# Per-chain difficulty of the 10th best share (-inf while fewer than 10 are
+# stored); shares below it can't make the top 10, so they skip the database
+_best_share_threshold: dict[str, float] = {}
+
+
+async def _load_best_share_threshold(db: aiosqlite.Connection, chain: str) -> float:
+    cursor = await db.execute(
+        """
+        SELECT share_difficulty FROM best_shares
+        WHERE chain = ?
+        ORDER BY share_difficulty DESC
+        LIMIT 1 OFFSET 9
+        """,
+        (chain,),
+    )
+    row = await cursor.fetchone()
+    return row[0] if row else float("-inf")
 
 
 async def record_best_share(
@@ -801,78 +1374,77 @@ async def record_best_share(
     try:
         difficulty_ratio = share_difficulty / target_difficulty
 
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Check if this share qualifies for top 10 for this chain
-            cursor = await db.execute(
+        # Fast path: most shares can't reach the top 10 for this chain
+        threshold = _best_share_threshold.get(chain)
+        if threshold is not None and share_difficulty < threshold:
+            return
+
+        async with _write_conn() as db:
+            threshold = _best_share_threshold.get(chain)
+            if threshold is None:
+                threshold = await _load_best_share_threshold(db, chain)
+                _best_share_threshold[chain] = threshold
+            if share_difficulty < threshold:
+                return
+
+            await db.execute(
                 """
-                SELECT COUNT(*) FROM best_shares 
-                WHERE chain = ? AND share_difficulty > ?
+                INSERT INTO best_shares 
+                (worker, chain, block_height, share_difficulty, target_difficulty, 
+                 difficulty_ratio, timestamp, miner_software)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (chain, share_difficulty),
+                (
+                    worker,
+                    chain,
+                    block_height,
+                    share_difficulty,
+                    target_difficulty,
+                    difficulty_ratio,
+                    timestamp,
+                    miner_software,
+                ),
             )
-            count_row = await cursor.fetchone()
-            better_shares = count_row[0] if count_row else 0
 
-            cursor = await db.execute(
+            # Keep only top 10 shares per chain
+            await db.execute(
                 """
-                SELECT COUNT(*) FROM best_shares WHERE chain = ?
+                DELETE FROM best_shares 
+                WHERE chain = ? AND id NOT IN (
+                    SELECT id FROM best_shares 
+                    WHERE chain = ? 
+                    ORDER BY share_difficulty DESC 
+                    LIMIT 10
+                )
                 """,
-                (chain,),
+                (chain, chain),
             )
-            count_row = await cursor.fetchone()
-            total_shares = count_row[0] if count_row else 0
-
-            # Only store if it's in top 10 or we have less than 10 shares
-            if better_shares < 10:
-                await db.execute(
-                    """
-                    INSERT INTO best_shares 
-                    (worker, chain, block_height, share_difficulty, target_difficulty, 
-                     difficulty_ratio, timestamp, miner_software)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        worker,
-                        chain,
-                        block_height,
-                        share_difficulty,
-                        target_difficulty,
-                        difficulty_ratio,
-                        timestamp,
-                        miner_software,
-                    ),
-                )
-
-                # Keep only top 10 shares per chain
-                if total_shares >= 10:
-                    await db.execute(
-                        """
-                        DELETE FROM best_shares 
-                        WHERE chain = ? AND id NOT IN (
-                            SELECT id FROM best_shares 
-                            WHERE chain = ? 
-                            ORDER BY share_difficulty DESC 
-                            LIMIT 10
-                        )
-                        """,
-                        (chain, chain),
-                    )
 
-                await db.commit()
-                logger.info(
-                    f"Recorded best share: {worker} found {share_difficulty:.2e} difficulty share "
-                    f"({difficulty_ratio:.2f}x target) on {chain}"
-                )
+            await db.commit()
+            _best_share_threshold[chain] = await _load_best_share_threshold(
+                db, chain
+            )
+            logger.info(
+                f"Recorded best share: {worker} found {share_difficulty:.2e} difficulty share "
+                f"({difficulty_ratio:.2f}x target) on {chain}"
+            )
 
     except Exception as e:
         logger.error(f"Error recording best share: {e}")
 
 
+async def clear_best_shares() -> int:
+    """Delete all best shares and reset the cached top-10 thresholds"""
+    async with _write_conn() as db:
+        cursor = await db.execute("DELETE FROM best_shares")
+        await db.commit()
+    _best_share_threshold.clear()
+    return cursor.rowcount
+
+
 async def get_best_shares(chain: str | None = None, limit: int = 10):
     """Get best shares, optionally filtered by chain"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with _read_conn() as db:
         if chain:
             cursor = await db.execute(
                 """
@@ -893,15 +1465,12 @@ async def get_best_shares(chain: str | None = None, limit: int = 10):
                 (limit,),
             )
 
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) async for row in cursor]
 
 
 async def get_unified_best_shares(limit: int = 10):
     """Get unified best shares for Radiant mining"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with _read_conn() as db:
         # Get best shares for RXD
         cursor = await db.execute(
             """
@@ -919,262 +1488,243 @@ async def get_unified_best_shares(limit: int = 10):
             (limit,),
         )
 
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) async for row in cursor]
 
 
 async def record_difficulty_snapshot(chain: str, difficulty: float):
     """Record a difficulty snapshot for history tracking"""
-    import time
+    _enqueue_write("difficulty_history", (chain, difficulty, int(time.time())))
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """
-            INSERT INTO difficulty_history (chain, difficulty, timestamp)
-            VALUES (?, ?, ?)
-            """,
-            (chain, difficulty, int(time.time())),
-        )
-        await db.commit()
 
+def _history_bucket_seconds(hours: int) -> int:
+    """Aggregation bucket size for a history window of `hours`"""
+    if hours <= 24:
+        # 24h: aggregate into 15-minute buckets (~96 points)
+        return 900
+    if hours <= 7 * 24:
+        # 7d: min/max of ~1-hour buckets (~336 points)
+        return 3600
+    # 30d+: min/max of ~4-hour buckets (~360 points)
+    return 14400
 
-async def get_difficulty_history(chain: str, hours: int = 24):
-    """Get difficulty history for a specific chain within the last N hours
 
-    For longer time ranges, data is downsampled to show meaningful trends:
-    - 24h: 15-minute aggregates (~96 points)
-    - 7d: 30-minute aggregates (~336 points)
-    - 30d: 2-hour aggregates (~360 points)
+async def _get_history(table: str, column: str, where: str, params: tuple, hours: int):
+    """Downsample `column` of `table` over the last `hours` to dashboard points
 
-    Also filters out zero/null values when not actively mining.
+    Up to 24h each bucket is averaged. Longer ranges keep each bucket's
+    minimum and maximum samples (at their own timestamps) instead, so spikes
+    survive downsampling rather than being smeared into a mean.
     """
-    import time
-
-    cutoff = int(time.time()) - (hours * 3600)
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
-            """
-            SELECT timestamp, difficulty
-            FROM difficulty_history
-            WHERE chain = ? AND timestamp > ? AND difficulty > 0
-            ORDER BY timestamp ASC
-            """,
-            (chain, cutoff),
-        )
-        rows = await cursor.fetchall()
+    bucket_seconds = _history_bucket_seconds(hours)
+
+    if hours <= 24:
+        sql = f"""
+            SELECT (timestamp / ?) * ? AS timestamp, AVG({column}) AS {column}
+            FROM {table}
+            WHERE {where}
+            GROUP BY 1
+            ORDER BY 1
+        """
+        sql_params = (bucket_seconds, bucket_seconds, *params)
+    else:
+        # SQLite takes the bare timestamp from the row holding the MIN/MAX
+        sql = f"""
+            SELECT timestamp, MIN({column}) AS {column}
+            FROM {table} WHERE {where} GROUP BY timestamp / ?
+            UNION
+            SELECT timestamp, MAX({column}) AS {column}
+            FROM {table} WHERE {where} GROUP BY timestamp / ?
+            ORDER BY 1
+        """
+        sql_params = (*params, bucket_seconds, *params, bucket_seconds)
 
-        # Determine aggregation bucket size based on time range
-        if hours <= 24:
-            # 24h: aggregate into 15-minute buckets (~96 points)
-            bucket_seconds = 900
-        elif hours <= 7 * 24:
-            # 7d: aggregate into ~30-minute buckets (~336 points)
-            bucket_seconds = 1800
-        else:
-            # 30d+: aggregate into ~2-hour buckets (~360 points)
-            bucket_seconds = 7200
+    async with _read_conn() as db:
+        cursor = await db.execute(sql, sql_params)
+        return [dict(row) async for row in cursor]
 
-        # Aggregate data into buckets
-        from collections import defaultdict
 
-        buckets = defaultdict(list)
+async def get_difficulty_history(chain: str, hours: int = 24):
+    """Get difficulty history for a specific chain within the last N hours
 
-        for row in rows:
-            # Put each data point into its bucket
-            bucket_idx = row["timestamp"] // bucket_seconds
-            buckets[bucket_idx].append(row["difficulty"])
+    For longer time ranges, data is downsampled to show meaningful trends:
+    - 24h: 15-minute averages (~96 points)
+    - 7d: 1-hour min/max pairs (~336 points)
+    - 30d: 4-hour min/max pairs (~360 points)
 
-        # Calculate average difficulty for each bucket
-        result = []
-        for bucket_idx in sorted(buckets.keys()):
-            difficulties = buckets[bucket_idx]
-            if difficulties:
-                avg_difficulty = sum(difficulties) / len(difficulties)
-                timestamp = bucket_idx * bucket_seconds
-                result.append({"timestamp": timestamp, "difficulty": avg_difficulty})
+    Also filters out zero/null values when not actively mining.
+    """
+    cutoff = int(time.time()) - (hours * 3600)
 
-        return result
+    return await _get_history(
+        "difficulty_history",
+        "difficulty",
+        "chain = ? AND timestamp > ? AND difficulty > 0",
+        (chain, cutoff),
+        hours,
+    )
 
 
 async def record_hashrate_snapshot(hashrate_hs: float):
     """Record a hashrate snapshot for history tracking"""
-    import time
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """
-            INSERT INTO hashrate_history (hashrate_hs, timestamp)
-            VALUES (?, ?)
-            """,
-            (hashrate_hs, int(time.time())),
-        )
-        await db.commit()
+    _enqueue_write("hashrate_history", (hashrate_hs, int(time.time())))
 
 
 async def get_hashrate_history(hours: int = 24):
     """Get hashrate history for the last N hours
 
     For longer time ranges, data is downsampled to show meaningful trends:
-    - 24h: 15-minute aggregates (~96 points)
-    - 7d: 30-minute aggregates (~336 points)
-    - 30d: 2-hour aggregates (~360 points)
+    - 24h: 15-minute averages (~96 points)
+    - 7d: 1-hour min/max pairs (~336 points)
+    - 30d: 4-hour min/max pairs (~360 points)
 
     Also filters out zero values when not actively mining.
     """
-    import time
-
     cutoff = int(time.time()) - (hours * 3600)
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
-            """
-            SELECT timestamp, hashrate_hs
-            FROM hashrate_history
-            WHERE timestamp > ? AND hashrate_hs > 0
-            ORDER BY timestamp ASC
-            """,
-            (cutoff,),
-        )
-        rows = await cursor.fetchall()
-
-        # Determine aggregation bucket size based on time range
-        if hours <= 24:
-            # 24h: aggregate into 15-minute buckets (~96 points)
-            bucket_seconds = 900
-        elif hours <= 7 * 24:
-            # 7d: aggregate into ~30-minute buckets (~336 points)
-            bucket_seconds = 1800
-        else:
-            # 30d+: aggregate into ~2-hour buckets (~360 points)
-            bucket_seconds = 7200
-
-        # Aggregate data into buckets
-        from collections import defaultdict
-
-        buckets = defaultdict(list)
-
-        for row in rows:
-            # Put each data point into its bucket
-            bucket_idx = row["timestamp"] // bucket_seconds
-            buckets[bucket_idx].append(row["hashrate_hs"])
-
-        # Calculate average hashrate for each bucket
-        result = []
-        for bucket_idx in sorted(buckets.keys()):
-            hashrates = buckets[bucket_idx]
-            if hashrates:
-                avg_hashrate = sum(hashrates) / len(hashrates)
-                timestamp = bucket_idx * bucket_seconds
-                result.append({"timestamp": timestamp, "hashrate_hs": avg_hashrate})
-
-        return result
+    return await _get_history(
+        "hashrate_history",
+        "hashrate_hs",
+        "timestamp > ? AND hashrate_hs > 0",
+        (cutoff,),
+        hours,
+    )
+
+
+# Upserts for record_miner_session; worker_name's UNIQUE autoindex resolves the conflict.
+# A NULL software string means "unknown", so that variant leaves the stored value alone.
+_MINER_SESSION_UPSERT = """
+    INSERT INTO miner_sessions (worker_name, miner_software, first_seen, last_seen, is_connected)
+    VALUES (?, ?, ?, ?, 1)
+    ON CONFLICT(worker_name) DO UPDATE SET
+        last_seen = excluded.last_seen,
+        is_connected = 1{software}
+"""
+_MINER_SESSION_UPSERT_SOFTWARE = _MINER_SESSION_UPSERT.format(
+    software=",\n        miner_software = excluded.miner_software"
+)
+_MINER_SESSION_UPSERT_KEEP_SOFTWARE = _MINER_SESSION_UPSERT.format(software="")
 
 
 async def record_miner_session(worker_name: str, miner_software: str | None = None):
     """Record or update a miner session"""
-    import time
-
     current_time = int(time.time())
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Try to update existing record
-        cursor = await db.execute(
-            """
-            UPDATE miner_sessions
-            SET last_seen = ?, is_connected = 1, miner_software = COALESCE(?, miner_software)
-            WHERE worker_name = ?
-            """,
-            (current_time, miner_software, worker_name),
-        )
-
-        # If no rows were updated, insert new record
-        if cursor.rowcount == 0:
-            await db.execute(
-                """
-                INSERT INTO miner_sessions (worker_name, miner_software, first_seen, last_seen, is_connected)
-                VALUES (?, ?, ?, ?, 1)
-                """,
-                (worker_name, miner_software, current_time, current_time),
-            )
-
+    sql = (
+        _MINER_SESSION_UPSERT_KEEP_SOFTWARE
+        if miner_software is None
+        else _MINER_SESSION_UPSERT_SOFTWARE
+    )
+
+    async with _write_conn() as db:
+        # Insert a new session or refresh the existing one in a single statement
+        await db.execute(sql, (worker_name, miner_software, current_time, current_time))
         await db.commit()
 
 
-async def get_connected_miners(offset: int = 0, limit: int = 20):
-    """Get connected miners with pagination"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
-        # Get total count
-        cursor = await db.execute(
-            "SELECT COUNT(*) as count FROM miner_sessions WHERE is_connected = 1"
+async def _get_miner_page(
+    where: str,
+    params: tuple,
+    offset: int,
+    limit: int,
+    cursor_last_seen: int | None,
+    cursor_worker: str | None,
+) -> dict:
+    """Fetch one page of miner_sessions matching `where`, plus the total and next cursor"""
+    if cursor_last_seen is None:
+        page_filter, page_clause, page_params = "", "LIMIT ? OFFSET ?", (limit, offset)
+    else:
+        page_filter, page_clause, page_params = (
+            "AND (last_seen, worker_name) < (?, ?)",
+            "LIMIT ?",
+            (cursor_last_seen, cursor_worker or "", limit),
         )
-        row = await cursor.fetchone()
-        total = row["count"] if row else 0
 
-        # Get paginated results
+    async with _read_conn() as db:
+        # The window count rides along with the page, saving a second query
         cursor = await db.execute(
-            """
-            SELECT worker_name, miner_software, first_seen, last_seen, is_connected
+            f"""
+            SELECT worker_name, miner_software, first_seen, last_seen, is_connected,
+                COUNT(*) OVER () AS total
             FROM miner_sessions
-            WHERE is_connected = 1
-            ORDER BY last_seen DESC
-            LIMIT ? OFFSET ?
+            WHERE {where} {page_filter}
+            ORDER BY last_seen DESC, worker_name DESC
+            {page_clause}
             """,
-            (limit, offset),
+            (*params, *page_params),
         )
-        rows = await cursor.fetchall()
-        return {
-            "miners": [dict(row) for row in rows],
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-        }
-
+        miners = [dict(row) async for row in cursor]
+        total = miners[0]["total"] if miners else 0
+        for miner in miners:
+            del miner["total"]
+
+        # A cursor narrows the window to the rows after it, and a page past
+        # the end has no rows to carry the count; count those separately
+        if cursor_last_seen is not None or (not miners and offset > 0):
+            cursor = await db.execute(
+                f"SELECT COUNT(*) FROM miner_sessions WHERE {where}", params
+            )
+            row = await cursor.fetchone()
+            total = row[0] if row else 0
+
+    return {
+        "miners": miners,
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": (
+            {
+                "last_seen": miners[-1]["last_seen"],
+                "worker_name": miners[-1]["worker_name"],
+            }
+            if miners
+            else None
+        ),
+    }
+
+
+async def get_connected_miners(
+    offset: int = 0,
+    limit: int = 20,
+    cursor_last_seen: int | None = None,
+    cursor_worker: str | None = None,
+):
+    """Get connected miners with pagination
 
-async def get_disconnected_miners(hours: int = 24, offset: int = 0, limit: int = 20):
-    """Get recently disconnected miners with pagination"""
-    import time
+    Pass the previous page's next_cursor values as cursor_last_seen and
+    cursor_worker for keyset paging, which seeks straight to the page
+    instead of scanning past `offset` rows.
+    """
+    return await _get_miner_page(
+        "is_connected = 1", (), offset, limit, cursor_last_seen, cursor_worker
+    )
 
-    cutoff = int(time.time()) - (hours * 3600)
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
+async def get_disconnected_miners(
+    hours: int = 24,
+    offset: int = 0,
+    limit: int = 20,
+    cursor_last_seen: int | None = None,
+    cursor_worker: str | None = None,
+):
+    """Get recently disconnected miners with pagination
 
-        # Get total count
-        cursor = await db.execute(
-            "SELECT COUNT(*) as count FROM miner_sessions WHERE is_connected = 0 AND last_seen > ?",
-            (cutoff,),
-        )
-        row = await cursor.fetchone()
-        total = row["count"] if row else 0
+    Pass the previous page's next_cursor values as cursor_last_seen and
+    cursor_worker for keyset paging.
+    """
+    cutoff = int(time.time()) - (hours * 3600)
 
-        # Get paginated results
-        cursor = await db.execute(
-            """
-            SELECT worker_name, miner_software, first_seen, last_seen, is_connected
-            FROM miner_sessions
-            WHERE is_connected = 0 AND last_seen > ?
-            ORDER BY last_seen DESC
-            LIMIT ? OFFSET ?
-            """,
-            (cutoff, limit, offset),
-        )
-        rows = await cursor.fetchall()
-        return {
-            "miners": [dict(row) for row in rows],
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-        }
+    return await _get_miner_page(
+        "is_connected = 0 AND last_seen > ?",
+        (cutoff,),
+        offset,
+        limit,
+        cursor_last_seen,
+        cursor_worker,
+    )
 
 
 async def delete_miner_session(worker_name: str):
     """Delete a miner session record"""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_conn() as db:
         await db.execute(
             "DELETE FROM miner_sessions WHERE worker_name = ?", (worker_name,)
         )
@@ -1183,9 +1733,7 @@ async def delete_miner_session(worker_name: str):
 
 async def mark_miner_disconnected(worker_name: str):
     """Mark a miner as disconnected"""
-    import time
-
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_conn() as db:
         await db.execute(
             """
             UPDATE miner_sessions
@@ -1212,14 +1760,12 @@ async def record_block_for_confirmation(
     Record a submitted block for confirmation tracking.
     Called when a block is submitted to track its confirmation count over time.
     """
-    import time
-
     current_time = int(time.time())
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with _write_conn() as db:
         await db.execute(
             """
-            INSERT INTO block_confirmations 
+            INSERT OR IGNORE INTO block_confirmations 
             (chain, height, block_hash, worker, confirmations, status, 
              last_check, first_submitted, submitted_timestamp)
             VALUES (?, ?, ?, ?, 0, 'pending', ?, ?, ?)
@@ -1254,36 +1800,31 @@ async def update_block_confirmations(
         confirmations: Current confirmation count
         is_orphaned: True if block is orphaned (not in main chain)
     """
-    import time
-
     current_time = int(time.time())
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Update all pending blocks (in case of chain reorg, multiple heights may be tracked)
-        if is_orphaned:
-            await db.execute(
-                """
-                UPDATE block_confirmations
-                SET confirmations = ?, status = 'orphaned', is_orphaned = 1, last_check = ?
-                WHERE chain = ? AND status = 'pending'
-            """,
-                (confirmations, current_time, chain),
-            )
+    async with _write_conn() as db:
+        # Update all pending blocks (in case of chain reorg, multiple heights may be tracked);
+        # an orphaning also flips status, otherwise already-orphaned rows are left alone
+        cursor = await db.execute(
+            """
+            UPDATE block_confirmations
+            SET confirmations = ?, last_check = ?,
+                status = CASE WHEN ? THEN 'orphaned' ELSE status END,
+                is_orphaned = CASE WHEN ? THEN 1 ELSE is_orphaned END
+            WHERE chain = ? AND status = 'pending' AND (? OR is_orphaned = 0)
+        """,
+            (confirmations, current_time, is_orphaned, is_orphaned, chain, is_orphaned),
+        )
+        if is_orphaned and cursor.rowcount > 0:
             logger.warning(f"{chain} block marked as orphaned")
-        else:
-            # Update confirmations for pending blocks
-            await db.execute(
-                """
-                UPDATE block_confirmations
-                SET confirmations = ?, last_check = ?
-                WHERE chain = ? AND status = 'pending' AND is_orphaned = 0
-            """,
-                (confirmations, current_time, chain),
-            )
 
         await db.commit()
 
 
+# Concurrent getblock calls when polling pending blocks
+_CONFIRMATION_RPC_CONCURRENCY = 8
+
+
 async def check_block_confirmations(
     chain: str,
     get_confirmations_func,
@@ -1302,13 +1843,9 @@ async def check_block_confirmations(
         notification_manager: For sending notifications
         skip_notifications: If True, skip sending notifications (used during initial seeding)
     """
-    import time
-
     current_time = int(time.time())
 
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with _read_conn() as db:
         # Get all pending blocks for this chain
         cursor = await db.execute(
             """
@@ -1321,93 +1858,122 @@ async def check_block_confirmations(
         )
         blocks = await cursor.fetchall()
 
-        for block in blocks:
-            try:
-                block_id = block["id"]
-                height = block["height"]
-                block_hash = block["block_hash"]
-                worker = block["worker"]
-                current_confirmations = block["confirmations"]
+    if not blocks:
+        return
 
-                # Query blockchain for current confirmation status
-                # Note: get_confirmations_func is a bound method that already has node_url context
-                confs, is_orphaned = await get_confirmations_func(block_hash)
+    logger.info(f"Checking confirmations for {len(blocks)} {chain} blocks")
 
-                logger.info(
-                    f"{chain} block {height}: {confs} confirmations, orphaned={is_orphaned}"
-                )
+    # Query the node for every block concurrently (bounded so a large backlog
+    # doesn't overrun its RPC work queue), without holding the write lock
+    semaphore = asyncio.Semaphore(_CONFIRMATION_RPC_CONCURRENCY)
 
-                # Update database with latest confirmation count
-                new_status = "pending"
-                if is_orphaned:
-                    new_status = "orphaned"
-                elif confs >= 61:
-                    new_status = "confirmed"
+    async def query(block_hash: str):
+        async with semaphore:
+            # Note: get_confirmations_func is a bound method that already has node_url context
+            return await get_confirmations_func(block_hash)
 
-                await db.execute(
-                    """
-                    UPDATE block_confirmations
-                    SET confirmations = ?, status = ?, is_orphaned = ?, last_check = ?
-                    WHERE id = ?
-                """,
-                    (confs, new_status, is_orphaned, current_time, block_id),
-                )
+    results = await asyncio.gather(
+        *(query(block["block_hash"]) for block in blocks), return_exceptions=True
+    )
 
-                # Send notification if status changed to orphaned
-                if is_orphaned and not block["is_orphaned"]:
-                    if not skip_notifications and notification_manager:
-                        await notification_manager.notify_block_orphaned(
-                            chain=chain,
-                            height=height,
-                            block_hash=block_hash,
-                            worker=worker,
-                        )
-                    logger.warning(
-                        f"🚫 {chain} BLOCK ORPHANED - Height: {height}, Worker: {worker}"
-                    )
-                    await db.execute(
-                        """
-                        UPDATE block_confirmations
-                        SET orphan_notification_sent = 1
-                        WHERE id = ?
-                    """,
-                        (block_id,),
-                    )
+    updates = []
+    for block, result in zip(blocks, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Error checking confirmations for {chain} block: {result}")
+            continue
+
+        confs, is_orphaned = result
+
+        logger.info(
+            f"{chain} block {block['height']}: {confs} confirmations, orphaned={is_orphaned}"
+        )
+
+        new_status = "pending"
+        if is_orphaned:
+            new_status = "orphaned"
+        elif confs >= 61:
+            new_status = "confirmed"
+
+        updates.append((confs, new_status, is_orphaned, current_time, block["id"]))
+
+    if not updates:
+        return
+
+    # Update database with latest confirmation counts in one transaction
+    checked_ids = json.dumps([row[-1] for row in updates])
+    async with _write_conn() as db:
+        await db.executemany(
+            """
+            UPDATE block_confirmations
+            SET confirmations = ?, status = ?, is_orphaned = ?, last_check = ?
+            WHERE id = ?
+        """,
+            updates,
+        )
+
+        # Only notify on the transition into orphaned / confirmed: claim the
+        # unsent notification flags and let SQLite report which rows flipped
+        cursor = await db.execute(
+            """
+            UPDATE block_confirmations
+            SET orphan_notification_sent = 1
+            WHERE id IN (SELECT value FROM json_each(?))
+                AND status = 'orphaned' AND orphan_notification_sent = 0
+            RETURNING height, block_hash, worker
+        """,
+            (checked_ids,),
+        )
+        orphaned = await cursor.fetchall()
 
-                # Send notification if block reaches 61 confirmations
-                if confs >= 61 and new_status == "confirmed":
-                    if not block["confirmations"] >= 61:  # Only notify on transition
-                        if not skip_notifications and notification_manager:
-                            await notification_manager.notify_block_confirmed(
-                                chain=chain,
-                                height=height,
-                                block_hash=block_hash,
-                                confirmations=confs,
-                                worker=worker,
-                            )
-                        logger.info(
-                            f"✓ {chain} BLOCK CONFIRMED (spending allowed) - Height: {height}, Confirmations: {confs}, Worker: {worker}"
-                        )
-                        await db.execute(
-                            """
-                            UPDATE block_confirmations
-                            SET notification_sent = 1
-                            WHERE id = ?
-                        """,
-                            (block_id,),
-                        )
-
-            except Exception as e:
-                logger.error(f"Error checking confirmations for {chain} block: {e}")
+        cursor = await db.execute(
+            """
+            UPDATE block_confirmations
+            SET notification_sent = 1
+            WHERE id IN (SELECT value FROM json_each(?))
+                AND status = 'confirmed' AND notification_sent = 0
+            RETURNING height, block_hash, worker, confirmations
+        """,
+            (checked_ids,),
+        )
+        confirmed = await cursor.fetchall()
 
         await db.commit()
 
+    for block in orphaned:
+        try:
+            if not skip_notifications and notification_manager:
+                await notification_manager.notify_block_orphaned(
+                    chain=chain,
+                    height=block["height"],
+                    block_hash=block["block_hash"],
+                    worker=block["worker"],
+                )
+            logger.warning(
+                f"🚫 {chain} BLOCK ORPHANED - Height: {block['height']}, Worker: {block['worker']}"
+            )
+        except Exception as e:
+            logger.error(f"Error sending orphan notification for {chain} block: {e}")
+
+    for block in confirmed:
+        try:
+            if not skip_notifications and notification_manager:
+                await notification_manager.notify_block_confirmed(
+                    chain=chain,
+                    height=block["height"],
+                    block_hash=block["block_hash"],
+                    confirmations=block["confirmations"],
+                    worker=block["worker"],
+                )
+            logger.info(
+                f"✓ {chain} BLOCK CONFIRMED (spending allowed) - Height: {block['height']}, Confirmations: {block['confirmations']}, Worker: {block['worker']}"
+            )
+        except Exception as e:
+            logger.error(f"Error sending confirmation notification for {chain} block: {e}")
+
 
 async def get_pending_blocks(chain: str | None = None):
     """Get all pending blocks awaiting confirmation"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with _read_conn() as db:
         if chain:
             cursor = await db.execute(
                 """
@@ -1426,15 +1992,12 @@ async def get_pending_blocks(chain: str | None = None):
             """
             )
 
-        blocks = await cursor.fetchall()
-        return [dict(row) for row in blocks]
+        return [dict(row) async for row in cursor]
 
 
 async def get_block_confirmation_status(chain: str | None = None, limit: int = 50):
     """Get recent block confirmation statuses"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-
+    async with _read_conn() as db:
         if chain:
             cursor = await db.execute(
                 """
@@ -1459,5 +2022,4 @@ async def get_block_confirmation_status(chain: str | None = None, limit: int = 5
                 (limit,),
             )
 
-        blocks = await cursor.fetchall()
-        return [dict(row) for row in blocks]
+        return [dict(row) async for row in cursor]
@@ -1,4 +1,4 @@
-import coloredlogs, logging
+import coloredlogs, logging, sys
 
 
 def setup_logging(log_level="INFO"):
@@ -10,7 +10,7 @@ def setup_logging(log_level="INFO"):
                   or boolean (True=DEBUG, False=INFO) for backwards compatibility
 
     Returns:
-        Logger instance configured with coloredlogs
+        Logger instance (colored output when stderr is a terminal)
     """
     # Handle backwards compatibility: boolean input
     if isinstance(log_level, bool):
@@ -31,7 +31,16 @@ def setup_logging(log_level="INFO"):
     # Configure root logger first (affects all child loggers)
     root_logger = logging.getLogger()
     root_logger.setLevel(level_const)
-    coloredlogs.install(level=log_level, milliseconds=True)
+    if sys.stderr.isatty():
+        coloredlogs.install(level=log_level, milliseconds=True)
+    else:
+        # Piped/container output gets no colors anyway; a plain formatter
+        # skips coloredlogs' per-record styling work
+        logging.basicConfig(
+            level=level_const,
+            format="%(asctime)s,%(msecs)03d %(name)s[%(process)d] %(levelname)s %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     # Get main application logger
     logger = logging.getLogger("Stratum-Proxy")
@@ -1,6 +1,7 @@
 import argparse
+from dataclasses import fields, replace
 from .run import run_with_settings
-from .config import Settings
+from .config import Settings, get_settings, set_settings
 
 
 def main():
@@ -31,16 +32,22 @@ def main():
     p.add_argument("--rxd-zmq-endpoint", default=None, help="RXD ZMQ endpoint")
     args = p.parse_args()
 
-    s = Settings()
+    s = get_settings()
+    overrides = {}
     for k, v in vars(args).items():
         if v is not None:
             # Handle ZMQ enable/disable logic
             if k == "enable_zmq" and v:
-                setattr(s, "enable_zmq", True)
+                overrides["enable_zmq"] = True
             elif k == "disable_zmq" and v:
-                setattr(s, "enable_zmq", False)
+                overrides["enable_zmq"] = False
             else:
-                setattr(s, k.replace("-", "_"), v)
+                overrides[k.replace("-", "_")] = v
+    # Settings is frozen - apply CLI overrides to a copy (unknown flags are ignored)
+    # and install it so every get_settings() caller sees the overrides
+    known = {f.name for f in fields(Settings)}
+    s = replace(s, **{k: v for k, v in overrides.items() if k in known})
+    set_settings(s)
 
     if not s.rpcuser or not s.rpcpass:
         raise SystemExit(
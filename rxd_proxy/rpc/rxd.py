@@ -1,7 +1,57 @@
 """
 Radiant blockchain RPC interface.
+
+Callers should pass the shared session from get_rpc_session(), whose pooled
+keep-alive connections spare each call a fresh TCP handshake with the node.
 """
 import json
+from typing import Optional
+
+from aiohttp import ClientSession, DummyCookieJar, TCPConnector
+
+_session: Optional[ClientSession] = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode(method: str, params: list) -> bytes:
+    """Encode a JSON-RPC request body as bytes so aiohttp sends it with a Content-Length."""
+    return json.dumps(
+        {"jsonrpc": "1.0", "id": "stratum", "method": method, "params": params}
+    ).encode()
+
+
+# Request bodies for the parameterless calls never change; encode them once
+_GETBLOCKTEMPLATE = _encode("getblocktemplate", [{}])
+_GETBLOCKCHAININFO = _encode("getblockchaininfo", [])
+_GETMININGINFO = _encode("getmininginfo", [])
+
+
+async def _call(session, node_url: str, payload: bytes):
+    async with session.post(node_url, data=payload, headers=_JSON_HEADERS) as resp:
+        return await resp.json()
+
+
+def get_rpc_session() -> ClientSession:
+    """Get or create the shared node RPC session (call from the event loop)."""
+    global _session
+    if _session is None or _session.closed:
+        _session = ClientSession(
+            connector=TCPConnector(
+                limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            # The node never sets cookies; skip the jar bookkeeping on every response
+            cookie_jar=DummyCookieJar(),
+        )
+    return _session
+
+
+async def close_rpc_session():
+    """Close the shared node RPC session (call on shutdown)."""
+    global _session
+    if _session is not None:
+        session, _session = _session, None
+        await session.close()
 
 
 async def getblocktemplate(session, node_url: str):
@@ -9,59 +59,24 @@ async def getblocktemplate(session, node_url: str):
     Get a block template from the Radiant node.
     Radiant doesn't use SegWit, so we request a standard template.
     """
-    data = {
-        "jsonrpc": "1.0",
-        "id": "stratum",
-        "method": "getblocktemplate",
-        "params": [{}],
-    }
-    async with session.post(node_url, data=json.dumps(data)) as resp:
-        return await resp.json()
+    return await _call(session, node_url, _GETBLOCKTEMPLATE)
 
 
 async def submitblock(session, node_url: str, block_hex: str):
     """Submit a solved block to the Radiant network."""
-    data = {
-        "jsonrpc": "1.0",
-        "id": "stratum",
-        "method": "submitblock",
-        "params": [block_hex],
-    }
-    async with session.post(node_url, data=json.dumps(data)) as resp:
-        return await resp.json()
+    return await _call(session, node_url, _encode("submitblock", [block_hex]))
 
 
 async def getblock(session, node_url: str, block_hash: str):
     """Query a block for confirmation status."""
-    data = {
-        "jsonrpc": "1.0",
-        "id": "stratum",
-        "method": "getblock",
-        "params": [block_hash],
-    }
-    async with session.post(node_url, data=json.dumps(data)) as resp:
-        return await resp.json()
+    return await _call(session, node_url, _encode("getblock", [block_hash]))
 
 
 async def getblockchaininfo(session, node_url: str):
     """Get blockchain info including chain tip."""
-    data = {
-        "jsonrpc": "1.0",
-        "id": "stratum",
-        "method": "getblockchaininfo",
-        "params": [],
-    }
-    async with session.post(node_url, data=json.dumps(data)) as resp:
-        return await resp.json()
+    return await _call(session, node_url, _GETBLOCKCHAININFO)
 
 
 async def getmininginfo(session, node_url: str):
     """Get mining-related information."""
-    data = {
-        "jsonrpc": "1.0",
-        "id": "stratum",
-        "method": "getmininginfo",
-        "params": [],
-    }
-    async with session.post(node_url, data=json.dumps(data)) as resp:
-        return await resp.json()
+    return await _call(session, node_url, _GETMININGINFO)
@@ -1,9 +1,9 @@
 import asyncio
 import time
-from .config import Settings
+from .config import Settings, get_settings
 from .logging_setup import setup_logging
 from .state.template import TemplateState
-from .state.updater import state_updater_loop, update_once
+from .state.updater import state_updater_loop
 from .stratum.server import start_server
 from .zmq.listener import ZMQListener
 
@@ -21,7 +21,7 @@ def run_with_settings(settings: Settings):
     state = TemplateState()
 
     async def main():
-        from aiohttp import ClientSession
+        from .rpc.rxd import get_rpc_session
 
         # Initialize database if enabled
         if settings.enable_database:
@@ -43,6 +43,13 @@ def run_with_settings(settings: Settings):
 
             # Start periodic snapshot task (runs every 60 seconds)
             async def periodic_snapshots():
+                from .db.schema import (
+                    record_difficulty_snapshot,
+                    record_hashrate_snapshot,
+                )
+                from .consensus.targets import target_hex_to_diff1
+                from .stratum.session import hashrate_tracker
+
                 last_snapshot_time = time.time()
                 while True:
                     try:
@@ -50,17 +57,10 @@ def run_with_settings(settings: Settings):
 
                         # Record difficulty and hashrate snapshot every 60 seconds
                         if current_time - last_snapshot_time >= 60:
-                            from .db.schema import (
-                                record_difficulty_snapshot,
-                                record_hashrate_snapshot,
-                            )
-                            from .consensus.targets import target_to_diff1
-
                             # Record difficulty snapshots
                             if state.target:
                                 try:
-                                    rxd_target_int = int(state.target, 16)
-                                    rxd_diff = target_to_diff1(rxd_target_int)
+                                    rxd_diff = target_hex_to_diff1(state.target)
                                     await record_difficulty_snapshot("RXD", rxd_diff)
                                 except Exception as e:
                                     logger.debug(
@@ -69,24 +69,18 @@ def run_with_settings(settings: Settings):
 
                             # Record hashrate snapshot
                             try:
-                                from .stratum.session import hashrate_tracker
-
                                 if hashrate_tracker:
                                     # Calculate aggregate hashrate from all connected sessions
+                                    # (instant rates only; skips the per-worker display formatting)
                                     total_hashrate_hs = 0.0
                                     if hasattr(state, "all_sessions"):
-                                        for session in state.all_sessions:
-                                            worker_name = getattr(
-                                                session, "_worker_name", None
-                                            )
-                                            if worker_name:
-                                                hashrate_info = hashrate_tracker.get_hashrate_display(
-                                                    worker_name
-                                                )
-                                                instant_hs = float(
-                                                    hashrate_info.get("instant", 0.0)
-                                                )
-                                                total_hashrate_hs += instant_hs
+                                        workers = [
+                                            getattr(session, "_worker_name", None)
+                                            for session in state.all_sessions
+                                        ]
+                                        total_hashrate_hs = hashrate_tracker.total_instant(
+                                            worker for worker in workers if worker
+                                        )
 
                                     # Always record hashrate snapshot (even if 0)
                                     logger.debug(
@@ -166,42 +160,58 @@ def run_with_settings(settings: Settings):
             server = uvicorn.Server(config)
             dashboard_task = asyncio.create_task(server.serve())
 
-        async with ClientSession() as http:
-            # ZMQ callback for new blocks
-            async def on_rxd_block(block_hash: str):
-                logger.debug("ZMQ: New RXD block %s, updating template", block_hash)
-                try:
-                    await update_once(state, settings, http, force_update=True)
-                except Exception as e:
-                    logger.error("Failed to update template on RXD block: %s", e)
+        # Shared keep-alive session to the node; closed in main_and_close
+        http = get_rpc_session()
 
-            # Create tasks
-            tasks = []
+        # ZMQ callback for new blocks
+        async def on_rxd_block(block_hash: str):
+            logger.debug("ZMQ: New RXD block %s, updating template", block_hash)
+            if confirmation_monitor:
+                confirmation_monitor.notify_new_block()
+            # The state updater refreshes the template as soon as it's woken
+            state.wake.set()
 
-            # Always start the state updater (now with reduced frequency when ZMQ is active)
-            tasks.append(asyncio.create_task(state_updater_loop(state, settings)))
+        # Create tasks
+        tasks = []
 
-            # Start stratum server
-            tasks.append(asyncio.create_task(start_server(state, settings)))
+        # Always start the state updater (now with reduced frequency when ZMQ is active)
+        tasks.append(asyncio.create_task(state_updater_loop(state, settings, http)))
 
-            # Start ZMQ listener if enabled
-            if settings.enable_zmq:
-                zmq_listener = ZMQListener(
-                    name="RXD",
-                    zmq_endpoint=settings.rxd_zmq_endpoint,
-                    on_block_callback=on_rxd_block,
-                )
-                tasks.append(asyncio.create_task(zmq_listener.start()))
+        # Start stratum server
+        tasks.append(asyncio.create_task(start_server(state, settings)))
+
+        # Start ZMQ listener if enabled
+        if settings.enable_zmq:
+            zmq_listener = ZMQListener(
+                name="RXD",
+                zmq_endpoint=settings.rxd_zmq_endpoint,
+                on_block_callback=on_rxd_block,
+            )
+            tasks.append(asyncio.create_task(zmq_listener.start()))
+
+        # Add dashboard task if enabled
+        if dashboard_task:
+            tasks.append(dashboard_task)
+
+        # Wait for any task to complete or fail
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+
+    async def main_and_close():
+        try:
+            await main()
+        finally:
+            # The shared SQLite connection runs on a non-daemon thread; the
+            # share feed may have opened it even with the database disabled
+            from .db.schema import close_database
+
+            await close_database()
 
-            # Add dashboard task if enabled
-            if dashboard_task:
-                tasks.append(dashboard_task)
+            from .rpc.rxd import close_rpc_session
 
-            # Wait for any task to complete or fail
-            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            await close_rpc_session()
 
-    asyncio.run(main())
+    asyncio.run(main_and_close())
 
 
 def run_from_env():
-    run_with_settings(Settings())
+    run_with_settings(get_settings())
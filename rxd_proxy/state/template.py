@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass, field
 from typing import Optional, List, Set
 from aiorpcx import RPCSession
@@ -22,6 +23,7 @@ class TemplateState:
     coinbase2: Optional[bytes] = None
     merkle_branches: List[str] = field(default_factory=list)
     coinbase_branch: List[bytes] = field(default_factory=list)
+    merkle_tx_rows: Optional[bytes] = None  # Packed LE txids coinbase_branch was built from
     coinbase_index: int = 0
     current_commitment: Optional[str] = None
     new_sessions: Set[RPCSession] = field(default_factory=set)
@@ -34,6 +36,9 @@ class TemplateState:
     coinbase1_nowit: Optional[bytes] = None
     coinbase2_nowit: Optional[bytes] = None
     advertised_diff: Optional[float] = None
+    job_params: Optional[list] = None  # mining.notify params of the current job, set on each roll
+    # Set to refresh the template now instead of at the next poll
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
 
     def __post_init__(self):
         import logging
@@ -41,16 +46,7 @@ class TemplateState:
         self.logger = logging.getLogger("Stratum-Proxy")
 
     def current_job_params(self):
-        if not (self.coinbase1_nowit and self.coinbase2_nowit and self.prevHash_le and self.bits):
+        if self.job_params is None:
             return None
-        return [
-            hex(self.job_counter)[2:],
-            self.prevHash_le.hex(),
-            self.coinbase1_nowit.hex(),
-            self.coinbase2_nowit.hex(),
-            self.merkle_branches,
-            self.version.to_bytes(4, "big").hex(),
-            self.bits,
-            self.timestamp.to_bytes(4, "big").hex(),
-            True,
-        ]
+        # Reuse the params built at roll time; a joining miner always starts clean
+        return [*self.job_params[:-1], True]
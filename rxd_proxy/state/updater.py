@@ -1,11 +1,14 @@
-import time, os, base58, logging
+import asyncio, time, os, base58, logging
 from aiohttp import ClientSession
+from aiorpcx import JSONRPCv1, Notification
 from ..rpc import rxd as rpc_rxd
-from ..consensus.merkle import merkle_root_from_txids_le, merkle_branch_for_index0
+from ..consensus.merkle import merkle_branch0_from_rows
 from ..consensus.coinbase import build_coinbase
 from ..consensus.targets import (
-    target_to_diff1,
+    target_hex_to_diff1,
 )
+from ..stratum import vardiff as _vardiff_mod
+from ..stratum.session import hashrate_tracker
 
 logger = logging.getLogger(__name__)
 
@@ -32,19 +35,21 @@ async def update_once(state, settings, http: ClientSession, force_update: bool =
     # Store prevHash - Radiant uses standard Bitcoin-style prevhash
     # The RPC gives us the hash in BE hex format (how hashes are displayed)
     prev_hash_be_bytes = bytes.fromhex(prev_hash_hex)  # Raw BE bytes
-    
-    # For the actual 80-byte header, we need LE bytes (simple reversal)
-    prev_hash_le_bytes = prev_hash_be_bytes[::-1]  # Reverse for header building
-    state.prevHash_header = prev_hash_le_bytes  # LE bytes for header building
-    
-    # For stratum mining.notify: word-swap the LE bytes (Bitcoin stratum protocol)
-    prevhash_words_swapped = []
-    for i in range(0, 32, 4):  # 32 bytes total, 4 bytes per word
-        word = prev_hash_le_bytes[i : i + 4]
-        prevhash_words_swapped.append(word[::-1])  # Swap each word's endianness
-
-    state.prevHash_be = prev_hash_be_bytes  # Original BE bytes
-    state.prevHash_le = b"".join(prevhash_words_swapped)  # Word-swapped for stratum notification
+
+    # The derived forms only change with the tip; polls between blocks keep them
+    if prev_hash_be_bytes != state.prevHash_be:
+        # For the actual 80-byte header, we need LE bytes (simple reversal)
+        prev_hash_le_bytes = prev_hash_be_bytes[::-1]  # Reverse for header building
+        state.prevHash_header = prev_hash_le_bytes  # LE bytes for header building
+
+        # For stratum mining.notify: word-swap the LE bytes (Bitcoin stratum protocol)
+        prevhash_words_swapped = []
+        for i in range(0, 32, 4):  # 32 bytes total, 4 bytes per word
+            word = prev_hash_le_bytes[i : i + 4]
+            prevhash_words_swapped.append(word[::-1])  # Swap each word's endianness
+
+        state.prevHash_be = prev_hash_be_bytes  # Original BE bytes
+        state.prevHash_le = b"".join(prevhash_words_swapped)  # Word-swapped for stratum notification
 
     new_block = state.height == -1 or state.height != height_int
     if new_block:
@@ -70,14 +75,7 @@ async def update_once(state, settings, http: ClientSession, force_update: bool =
         if not state.pub_h160:
             return False
 
-        (
-            coinbase_tx,
-            coinbase_txid,
-            coinbase1,
-            coinbase2,
-            coinbase1_nowit,
-            coinbase2_nowit,
-        ) = build_coinbase(
+        coinbase_tx, coinbase_txid, coinbase1, coinbase2 = build_coinbase(
             pub_h160=state.pub_h160,
             height=state.height,
             arbitrary=arbitrary,
@@ -88,19 +86,23 @@ async def update_once(state, settings, http: ClientSession, force_update: bool =
         state.coinbase_txid = coinbase_txid
         state.coinbase1 = coinbase1
         state.coinbase2 = coinbase2
-        state.coinbase1_nowit = coinbase1_nowit
-        state.coinbase2_nowit = coinbase2_nowit
+        state.coinbase1_nowit = coinbase1
+        state.coinbase2_nowit = coinbase2
+
+        state.externalTxs = [tx["data"] for tx in txs_list]
 
-        incoming_txs = []
-        txids = [state.coinbase_txid]
-        for tx in txs_list:
-            incoming_txs.append(tx["data"])
-            txids.append(bytes.fromhex(tx["txid"])[::-1])
-        state.externalTxs = incoming_txs
+        # Decoding the txids back to front and reversing the whole buffer yields
+        # every txid byte-reversed (LE) in template order, without a per-tx loop
+        tx_rows = bytes.fromhex("".join(tx["txid"] for tx in reversed(txs_list)))[::-1]
 
-        merkle = merkle_root_from_txids_le(txids)
-        state.coinbase_branch = merkle_branch_for_index0(txids)
-        state.merkle_branches = [h.hex() for h in state.coinbase_branch]
+        # The index-0 branch never includes the coinbase itself, so ntime rolls
+        # over an unchanged tx set can keep the branch they already have
+        if tx_rows != state.merkle_tx_rows:
+            state.coinbase_branch = merkle_branch0_from_rows(
+                state.coinbase_txid + tx_rows
+            )
+            state.merkle_branches = [h.hex() for h in state.coinbase_branch]
+            state.merkle_tx_rows = tx_rows
 
         state.bits_le = bytes.fromhex(bits_hex)[::-1]
         state.timestamp = ts
@@ -109,87 +111,110 @@ async def update_once(state, settings, http: ClientSession, force_update: bool =
         state.job_counter = ts
 
         # Network difficulty (diff1-scaled) based on target
-        t_int = int(state.target, 16)
-        network_diff = target_to_diff1(t_int)
-        state.advertised_diff = network_diff
+        state.advertised_diff = target_hex_to_diff1(state.target)
 
         # Per-share difficulty we tell miners (static value when VarDiff disabled)
         difficulty = settings.static_share_difficulty
 
         clean = not roll_due or new_block
         job_params = [
-            hex(state.job_counter)[2:],
+            f"{state.job_counter:x}",
             state.prevHash_le.hex(),
             state.coinbase1_nowit.hex(),
             state.coinbase2_nowit.hex(),
             state.merkle_branches,
-            version_int.to_bytes(4, "big").hex(),
+            f"{version_int:08x}",
             bits_hex,
-            ts.to_bytes(4, "big").hex(),
+            f"{ts:08x}",
             clean,
         ]
+        state.job_params = job_params
 
-        alive = set()
-        for sess in list(state.all_sessions):
-            try:
-                # If VarDiff is enabled, preserve the session's current difficulty
-                # Otherwise use the fixed divisor-based difficulty
-                from ..stratum import vardiff as _vardiff_mod
-                if _vardiff_mod.vardiff_manager is not None:
-                    sess_diff = getattr(sess, "_share_difficulty", None)
-                    if sess_diff is None or sess_diff <= 0:
-                        setattr(sess, "_share_difficulty", difficulty)
-                        await sess.send_notification("mining.set_difficulty", (difficulty,))
-                    # Don't send set_difficulty - VarDiff manages this
-                else:
-                    setattr(sess, "_share_difficulty", difficulty)
-                    await sess.send_notification("mining.set_difficulty", (difficulty,))
-                await sess.send_notification("mining.notify", job_params)
-            except Exception as e:
-                state.logger.debug("Dropping dead session %r: %s", sess, e)
-                try:
-                    wid = getattr(sess, "_worker_id", None)
-                    if wid:
-                        from ..stratum.session import hashrate_tracker
-
-                        hashrate_tracker.remove_worker(wid)
-                except Exception as e:
-                    logger.debug(
-                        "Failed to remove worker %s from hashrate tracker: %s", wid, e
-                    )
+        # Every session speaks JSONRPCv1, so encode the broadcast messages once
+        set_difficulty_msg = JSONRPCv1.notification_message(
+            Notification("mining.set_difficulty", (difficulty,))
+        )
+        notify_msg = JSONRPCv1.notification_message(
+            Notification("mining.notify", job_params)
+        )
+
+        vardiff_enabled = _vardiff_mod.vardiff_manager is not None
+
+        async def notify(sess, is_new):
+            # New sessions get the fixed difficulty initially; VarDiff adjusts after
+            # the first shares. For the rest, if VarDiff is enabled, preserve the
+            # session's current difficulty, otherwise use the fixed difficulty
+            if vardiff_enabled and not is_new:
+                sess_diff = getattr(sess, "_share_difficulty", None)
+                if sess_diff is None or sess_diff <= 0:
+                    sess._share_difficulty = difficulty
+                    await sess.send_encoded_notification(set_difficulty_msg)
+                # Don't send set_difficulty - VarDiff manages this
+            else:
+                sess._share_difficulty = difficulty
+                await sess.send_encoded_notification(set_difficulty_msg)
+            await sess.send_encoded_notification(notify_msg)
+
+        # Take ownership of the pending new sessions up front; any that subscribe
+        # while the sends below are in flight wait for the next update
+        new_sessions = state.new_sessions
+        state.new_sessions = set()
+
+        # Sessions whose transport is already closing are dropped up front
+        # rather than discovered through a failed send
+        targets, dead = [], []
+        for sess in state.all_sessions:
+            (dead if sess.is_closing() else targets).append((sess, False))
+        targets.extend((sess, True) for sess in new_sessions if not sess.is_closing())
+
+        # Fan out to every miner at once so one slow socket doesn't delay the rest
+        results = await asyncio.gather(
+            *(notify(sess, is_new) for sess, is_new in targets), return_exceptions=True
+        )
+
+        initialized = set()
+        for (sess, is_new), result in zip(targets, results):
+            # CancelledError is a BaseException, and a cancelled send still failed
+            if not isinstance(result, BaseException):
+                if is_new:
+                    initialized.add(sess)
+            elif is_new:
+                state.logger.debug("Failed initializing new session %r: %s", sess, result)
             else:
-                alive.add(sess)
-        state.all_sessions = alive
+                state.logger.debug("Dropping dead session %r: %s", sess, result)
+                dead.append(sess)
 
-        for sess in list(state.new_sessions):
+        # Update in place so sessions authorized during the sends are kept
+        state.all_sessions.difference_update(dead)
+        state.all_sessions.update(initialized)
+
+        for sess in dead:
             try:
-                # New sessions get the fixed difficulty initially
-                # VarDiff will adjust after first shares
-                setattr(sess, "_share_difficulty", difficulty)
-                await sess.send_notification("mining.set_difficulty", (difficulty,))
-                await sess.send_notification("mining.notify", job_params)
-                state.all_sessions.add(sess)
+                wid = getattr(sess, "_worker_id", None)
+                if wid:
+                    hashrate_tracker.remove_worker(wid)
             except Exception as e:
-                state.logger.debug("Failed initializing new session %r: %s", sess, e)
-        state.new_sessions.clear()
+                logger.debug(
+                    "Failed to remove worker %s from hashrate tracker: %s", wid, e
+                )
 
     return True
 
 
-async def state_updater_loop(state, settings):
-    from aiohttp import ClientSession
-    import asyncio
+async def state_updater_loop(state, settings, http: ClientSession):
+    # With ZMQ, block notifications wake the loop; polling is only a fallback
+    poll_interval = 10.0 if getattr(settings, "enable_zmq", False) else 1.0
 
-    async with ClientSession() as http:
-        while True:
-            try:
-                await update_once(state, settings, http)
-            except Exception as e:
-                state.logger.critical("State updater error: %s", e)
-                await asyncio.sleep(5)
+    while True:
+        # Cleared before the refresh so a wakeup arriving mid-update isn't lost
+        state.wake.clear()
+        try:
+            await update_once(state, settings, http)
+        except Exception as e:
+            state.logger.critical("State updater error: %s", e)
+            await asyncio.sleep(5)
 
-            # Adjust sleep based on ZMQ availability
-            if getattr(settings, "enable_zmq", False):
-                await asyncio.sleep(10.0)
-            else:
-                await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(state.wake.wait(), timeout=poll_interval)
+        except asyncio.TimeoutError:
+            pass
@@ -4,7 +4,9 @@ import json
 import logging
 import asyncio
 import math
+import operator
 import time
+from collections import deque
 
 from aiorpcx import (
     RPCSession,
@@ -20,10 +22,26 @@ from ..utils.enc import bech32_decode
 from ..consensus.merkle import fold_branch_index0
 from ..consensus.header import build_header80_le
 from ..utils.hashers import dsha256, sha512_256d, radiant_pow
-from aiohttp import ClientSession
+from ..rpc.rxd import get_rpc_session
 from ..consensus.targets import target_to_diff1
 from . import vardiff as _vardiff_mod
 
+# The database layer needs aiosqlite; without it, database features are skipped
+try:
+    from ..db.schema import (
+        log_block_found,
+        log_connection_event,
+        mark_miner_disconnected,
+        record_best_share,
+        record_block_for_confirmation,
+        record_miner_session,
+        update_share_stats,
+    )
+
+    _DB_AVAILABLE = True
+except ImportError:
+    _DB_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Hashrate tracking based on share submissions - initialized after class definition
@@ -33,20 +51,17 @@ hashrate_tracker: "HashrateTracker"
 async def _log_share_stats_background(
     worker: str, timestamp: int, accepted: bool, difficulty: float
 ):
-    """Background task for logging share statistics without blocking share responses"""
-    try:
-        from ..db.schema import update_share_stats
-
-        await update_share_stats(
-            worker=worker,
-            timestamp=timestamp,
-            accepted=accepted,
-            difficulty=difficulty,
-        )
-    except ImportError:
-        pass  # Database not enabled
-    except Exception as e:
-        logger.debug("Background share stats logging failed: %s", e)
+    """Log share statistics; this only queues the write, so it never blocks share responses"""
+    if _DB_AVAILABLE:
+        try:
+            await update_share_stats(
+                worker=worker,
+                timestamp=timestamp,
+                accepted=accepted,
+                difficulty=difficulty,
+            )
+        except Exception as e:
+            logger.debug("Background share stats logging failed: %s", e)
 
 
 async def _record_best_share_background(
@@ -59,51 +74,71 @@ async def _record_best_share_background(
     miner_software: str | None = None,
 ):
     """Background task for recording potential best shares"""
-    try:
-        from ..db.schema import record_best_share
-
-        # Debug logging for high difficulty shares
-        if share_difficulty > 100:
-            logger.info(
-                f"BEST SHARE BACKGROUND - {chain}: diff={share_difficulty:.2f}, "
-                f"target={target_difficulty:.2f}, ratio={share_difficulty/target_difficulty:.6f}"
-            )
+    if _DB_AVAILABLE:
+        try:
+            # Debug logging for high difficulty shares
+            if share_difficulty > 100:
+                logger.info(
+                    f"BEST SHARE BACKGROUND - {chain}: diff={share_difficulty:.2f}, "
+                    f"target={target_difficulty:.2f}, ratio={share_difficulty/target_difficulty:.6f}"
+                )
 
-        await record_best_share(
-            worker=worker,
-            chain=chain,
-            block_height=block_height,
-            share_difficulty=share_difficulty,
-            target_difficulty=target_difficulty,
-            timestamp=timestamp,
-            miner_software=miner_software,
-        )
-    except ImportError:
-        logger.warning("Database import failed for best share recording")
-    except Exception as e:
-        logger.error(f"Error in best share background task: {e}")
-        # Don't let best share tracking interfere with mining
+            await record_best_share(
+                worker=worker,
+                chain=chain,
+                block_height=block_height,
+                share_difficulty=share_difficulty,
+                target_difficulty=target_difficulty,
+                timestamp=timestamp,
+                miner_software=miner_software,
+            )
+        except Exception as e:
+            logger.error(f"Error in best share background task: {e}")
+            # Don't let best share tracking interfere with mining
 
 
 class HashrateTracker:
     """Enhanced hashrate tracker with EMA smoothing & confidence metrics."""
 
+    # How long a get_hashrate_display result may be reused between shares
+    DISPLAY_CACHE_SECONDS = 1.0
+
     def __init__(self, window_seconds: int = 300, ema_half_life: int = 120):
         self.window_seconds = window_seconds
         self.ema_half_life = ema_half_life
-        # worker -> list[(timestamp, difficulty, accepted)]
-        self.worker_shares: dict[str, list[tuple[float, float, bool]]] = {}
+        # worker -> deque[(timestamp, difficulty, accepted)], oldest first
+        self.worker_shares: dict[str, deque[tuple[float, float, bool]]] = {}
+        # worker -> accepted (timestamp, difficulty) from worker_shares, and their difficulty sum
+        self.worker_accepted: dict[str, deque[tuple[float, float]]] = {}
+        self.worker_accepted_diff: dict[str, float] = {}
         # worker -> (ema_hashrate_hs, last_update_ts)
         self.worker_ema: dict[str, tuple[float, float]] = {}
+        # worker -> (computed_at, get_hashrate_display result); dropped on each share
+        self._display_cache: dict[str, tuple[float, dict]] = {}
 
     def add_share(self, worker: str, difficulty: float, accepted: bool = True):
-        import time
-
         now = time.time()
-        shares = self.worker_shares.setdefault(worker, [])
-        shares.append((now, difficulty, accepted))
         cutoff = now - self.window_seconds
-        self.worker_shares[worker] = [s for s in shares if s[0] >= cutoff]
+        self._display_cache.pop(worker, None)
+        shares = self.worker_shares.get(worker)
+        if shares is None:
+            shares = self.worker_shares[worker] = deque()
+            self.worker_accepted[worker] = deque()
+            self.worker_accepted_diff[worker] = 0.0
+        shares.append((now, difficulty, accepted))
+        while shares[0][0] < cutoff:
+            shares.popleft()
+
+        # Keep the accepted window and its running sum in step with worker_shares
+        acc = self.worker_accepted[worker]
+        total_d = self.worker_accepted_diff[worker]
+        if accepted:
+            acc.append((now, difficulty))
+            total_d += difficulty
+        while acc and acc[0][0] < cutoff:
+            total_d -= acc.popleft()[1]
+        self.worker_accepted_diff[worker] = total_d if acc else 0.0
+
         inst = self._instant(worker, now)
         ema_val, last_ts = self.worker_ema.get(worker, (inst, now))
         dt = max(0.0, now - last_ts)
@@ -118,17 +153,27 @@ class HashrateTracker:
         self.worker_ema[worker] = (ema_val, now)
 
     def _instant(self, worker: str, now: float | None = None) -> float:
-        if worker not in self.worker_shares:
+        acc = self.worker_accepted.get(worker)
+        if not acc:
             return 0.0
         if now is None:
-            import time
-
             now = time.time()
         cutoff = now - self.window_seconds
-        accepted = [s for s in self.worker_shares[worker] if s[2] and s[0] >= cutoff]
-        if not accepted:
-            return 0.0
-        oldest = min(ts for ts, *_ in accepted)
+        if acc[0][0] >= cutoff:
+            # Nothing has expired since the last share: use the running sum
+            oldest = acc[0][0]
+            total_d = self.worker_accepted_diff[worker]
+        else:
+            # Read after some shares aged out: one pass over the unexpired tail
+            oldest = None
+            total_d = 0.0
+            for ts, diff in acc:
+                if ts >= cutoff:
+                    if oldest is None:
+                        oldest = ts
+                    total_d += diff
+            if oldest is None:
+                return 0.0
         span = now - max(cutoff, oldest)
 
         # For very short spans (especially with 1-2 shares), use a minimum reasonable window
@@ -138,14 +183,15 @@ class HashrateTracker:
         if span < MIN_SPAN:
             span = MIN_SPAN
 
-        total_d = sum(diff for ts, diff, _ in accepted)
         return (total_d * (2**32)) / span if total_d > 0 else 0.0
 
+    def total_instant(self, workers) -> float:
+        """Sum the instantaneous hashrate (H/s) of `workers` at a single timestamp."""
+        now = time.time()
+        return sum(self._instant(worker, now) for worker in workers)
+
     def _confidence(self, worker: str) -> tuple[int, float]:
-        if worker not in self.worker_shares:
-            return 0, 1.0
-        accepted = [s for s in self.worker_shares[worker] if s[2]]
-        n = len(accepted)
+        n = len(self.worker_accepted.get(worker, ()))
         if n == 0:
             return 0, 1.0
         return n, 1 / math.sqrt(n)
@@ -161,7 +207,13 @@ class HashrateTracker:
                 "shares": 0,
                 "rel_error": 1.0,
             }
-        inst = self._instant(worker)
+        # Dashboard endpoints ask for every worker on each poll; between shares the
+        # figures only drift with time, so reuse them for a short while
+        now = time.time()
+        cached = self._display_cache.get(worker)
+        if cached is not None and now - cached[0] < self.DISPLAY_CACHE_SECONDS:
+            return cached[1]
+        inst = self._instant(worker, now)
         ema_val, _ = self.worker_ema.get(worker, (inst, 0.0))
         n_shares, rel_err = self._confidence(worker)
         display_hs = ema_val if ema_val > 0 else inst
@@ -173,7 +225,7 @@ class HashrateTracker:
             value, unit = display_hs / 1_000, "KH/s"
         else:
             value, unit = display_hs, "H/s"
-        return {
+        result = {
             "value": value,
             "unit": unit,
             "display": f"{value:.2f} {unit}",
@@ -182,6 +234,8 @@ class HashrateTracker:
             "shares": n_shares,
             "rel_error": rel_err,
         }
+        self._display_cache[worker] = (now, result)
+        return result
 
     def get_hashrate_mhs(self, worker: str) -> float:
         result = self.get_hashrate_display(worker)
@@ -207,12 +261,9 @@ class HashrateTracker:
                 "share_count": 0,
             }
 
-        import time
-
         now = time.time()
 
-        shares = self.worker_shares[worker]
-        accepted = [s for s in shares if s[2]]  # Only accepted shares
+        accepted = list(self.worker_accepted[worker])  # Only accepted shares
 
         avg_interval = None
         ema_interval = None
@@ -226,20 +277,19 @@ class HashrateTracker:
                 avg_interval = span / (len(accepted) - 1)
 
             # Calculate EMA of inter-share intervals
-            intervals = []
-            for i in range(1, len(accepted)):
-                interval = accepted[i][0] - accepted[i - 1][0]
-                intervals.append(interval)
+            timestamps = [ts for ts, _ in accepted]
+            intervals = list(map(operator.sub, timestamps[1:], timestamps))
 
             if intervals:
+                # Apply EMA with half-life of 120 seconds (one step per interval,
+                # so the smoothing factor is the same for every sample)
+                alpha = (
+                    1 - math.exp(-1.0 / self.ema_half_life)
+                    if self.ema_half_life > 0
+                    else 1.0
+                )
                 ema_val = intervals[0]
                 for interval in intervals[1:]:
-                    # Apply EMA with half-life of 120 seconds
-                    alpha = (
-                        1 - math.exp(-1.0 / self.ema_half_life)
-                        if self.ema_half_life > 0
-                        else 1.0
-                    )
                     ema_val = alpha * interval + (1 - alpha) * ema_val
                 ema_interval = ema_val
 
@@ -259,6 +309,19 @@ class HashrateTracker:
     def remove_worker(self, worker: str):
         """Remove worker from tracking"""
         self.worker_shares.pop(worker, None)
+        self.worker_accepted.pop(worker, None)
+        self.worker_accepted_diff.pop(worker, None)
+        self._display_cache.pop(worker, None)
+
+    def clear(self) -> int:
+        """Forget every worker's shares and EMA; returns how many workers were tracked."""
+        cleared = len(self.worker_shares)
+        self.worker_shares.clear()
+        self.worker_accepted.clear()
+        self.worker_accepted_diff.clear()
+        self.worker_ema.clear()
+        self._display_cache.clear()
+        return cleared
 
 
 # Global hashrate tracker instance
@@ -306,6 +369,7 @@ class StratumSession(RPCSession):
         self._transport = transport
         self._node_url = node_url
         self._extranonce1 = None
+        self._extranonce1_bytes = b""  # Decoded once at subscribe, reused per share
         self.logger = logging.getLogger("Stratum-Proxy")
         self._keepalive_task = None  # Keepalive task reference
         self._last_activity = None  # Track last activity time
@@ -341,6 +405,10 @@ class StratumSession(RPCSession):
 
         return await handler_invocation(handler, request)()
 
+    async def send_encoded_notification(self, message: bytes):
+        """Send a notification already encoded with JSONRPCv1, e.g. one broadcast to every session"""
+        await self._send_message(message)
+
     async def connection_lost(self):
         # Send disconnection notification
         worker = getattr(self, "_worker_name", None)
@@ -352,30 +420,23 @@ class StratumSession(RPCSession):
             )
 
             # Mark miner as disconnected in database
-            try:
-                from ..db.schema import mark_miner_disconnected
-
-                await mark_miner_disconnected(worker)
-            except ImportError:
-                pass  # Database not enabled
-            except Exception as e:
-                self.logger.debug("Miner session disconnect marking failed: %s", e)
+            if _DB_AVAILABLE:
+                try:
+                    await mark_miner_disconnected(worker)
+                except Exception as e:
+                    self.logger.debug("Miner session disconnect marking failed: %s", e)
 
             # Log to database if enabled
-            try:
-                from ..db.schema import log_connection_event
-                import time
-
-                await log_connection_event(
-                    worker=worker,
-                    miner_software=miner_software or "Unknown",
-                    event_type="disconnected",
-                    timestamp=int(time.time()),
-                )
-            except ImportError:
-                pass  # Database not enabled
-            except Exception as e:
-                self.logger.debug("Database logging failed: %s", e)
+            if _DB_AVAILABLE:
+                try:
+                    await log_connection_event(
+                        worker=worker,
+                        miner_software=miner_software or "Unknown",
+                        event_type="disconnected",
+                        timestamp=int(time.time()),
+                    )
+                except Exception as e:
+                    self.logger.debug("Database logging failed: %s", e)
 
         # Cancel keepalive task
         if self._keepalive_task and not self._keepalive_task.done():
@@ -416,7 +477,8 @@ class StratumSession(RPCSession):
             self._state.new_sessions.add(self)
         self._state.bits_counter += 1
         subscription_id = f"subscription_{self._state.bits_counter}"
-        self._extranonce1 = self._state.bits_counter.to_bytes(4, "big").hex()
+        self._extranonce1_bytes = self._state.bits_counter.to_bytes(4, "big")
+        self._extranonce1 = self._extranonce1_bytes.hex()
         extranonce2_size = 4
 
         # Capture miner software name/version from first parameter
@@ -475,8 +537,6 @@ class StratumSession(RPCSession):
         self._state.new_sessions.discard(self)
 
         # Store connection time for uptime tracking
-        import time
-
         self._connection_time = time.time()
 
         # Send connection notification
@@ -487,33 +547,26 @@ class StratumSession(RPCSession):
         )
 
         # Record miner session in database
-        try:
-            from ..db.schema import record_miner_session
-
-            await record_miner_session(
-                worker_name=username,
-                miner_software=miner_software or "Unknown",
-            )
-        except ImportError:
-            pass  # Database not enabled
-        except Exception as e:
-            self.logger.debug("Miner session recording failed: %s", e)
+        if _DB_AVAILABLE:
+            try:
+                await record_miner_session(
+                    worker_name=username,
+                    miner_software=miner_software or "Unknown",
+                )
+            except Exception as e:
+                self.logger.debug("Miner session recording failed: %s", e)
 
         # Log to database if enabled
-        try:
-            from ..db.schema import log_connection_event
-            import time
-
-            await log_connection_event(
-                worker=username,
-                miner_software=miner_software or "Unknown",
-                event_type="connected",
-                timestamp=int(time.time()),
-            )
-        except ImportError:
-            pass  # Database not enabled
-        except Exception as e:
-            self.logger.debug("Database logging failed: %s", e)
+        if _DB_AVAILABLE:
+            try:
+                await log_connection_event(
+                    worker=username,
+                    miner_software=miner_software or "Unknown",
+                    event_type="connected",
+                    timestamp=int(time.time()),
+                )
+            except Exception as e:
+                self.logger.debug("Database logging failed: %s", e)
 
         # Start keepalive task
         if not self._keepalive_task or self._keepalive_task.done():
@@ -642,12 +695,13 @@ class StratumSession(RPCSession):
         # Snapshot state for consistent block building
         coinbase1_nowit_snapshot = state.coinbase1_nowit
         coinbase2_nowit_snapshot = state.coinbase2_nowit
-        merkle_branches_snapshot = list(state.merkle_branches)
+        # Raw branch bytes (the updater replaces the list, never mutates it)
+        coinbase_branch_snapshot = state.coinbase_branch
         version_snapshot = state.version
         prevHash_header_snapshot = state.prevHash_header  # LE bytes for header building
         bits_le_snapshot = state.bits_le
 
-        if job_id != hex(state.job_counter)[2:]:
+        if job_id != f"{state.job_counter:x}":
             self.logger.error("Miner submitted unknown/old job %s", job_id)
             return False
 
@@ -669,24 +723,27 @@ class StratumSession(RPCSession):
         assert coinbase1_nowit_snapshot is not None
         assert coinbase2_nowit_snapshot is not None
 
-        en1 = bytes.fromhex(self._extranonce1 or "")
+        en1 = self._extranonce1_bytes
         en2 = bytes.fromhex(extranonce2_hex)
 
         coinbase_tx = state.coinbase1 + en1 + en2 + state.coinbase2
         coinbase_nowit = coinbase1_nowit_snapshot + en1 + en2 + coinbase2_nowit_snapshot
         coinbase_txid_le = dsha256(coinbase_nowit)
 
-        merkle_root_le = fold_branch_index0(
-            coinbase_txid_le, [bytes.fromhex(x) for x in merkle_branches_snapshot]
-        )
+        merkle_root_le = fold_branch_index0(coinbase_txid_le, coinbase_branch_snapshot)
 
         ntime_le = bytes.fromhex(ntime_hex)[::-1]
         nonce_le = bytes.fromhex(nonce_hex)[::-1]
-        
+
+        # Per-share debug lines hex-encode several buffers; skip building
+        # them entirely unless debug logging is on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         # Debug: Log header components
-        self.logger.debug(f"Header build - version: {version_snapshot}, prevHash_header: {prevHash_header_snapshot.hex()}")
-        self.logger.debug(f"Header build - merkle_root_le: {merkle_root_le.hex()}, ntime_le: {ntime_le.hex()}, bits_le: {bits_le_snapshot.hex()}, nonce_le: {nonce_le.hex()}")
-        
+        if debug:
+            self.logger.debug(f"Header build - version: {version_snapshot}, prevHash_header: {prevHash_header_snapshot.hex()}")
+            self.logger.debug(f"Header build - merkle_root_le: {merkle_root_le.hex()}, ntime_le: {ntime_le.hex()}, bits_le: {bits_le_snapshot.hex()}, nonce_le: {nonce_le.hex()}")
+
         header80 = build_header80_le(
             version_snapshot,
             prevHash_header_snapshot,  # Use LE bytes for header (not word-swapped)
@@ -696,15 +753,17 @@ class StratumSession(RPCSession):
             nonce_le,
         )
 
-        self.logger.debug(f"Header80 ({len(header80)} bytes): {header80.hex()}")
+        if debug:
+            self.logger.debug(f"Header80 ({len(header80)} bytes): {header80.hex()}")
 
         block_hash = dsha256(header80)[::-1]
 
         # Calculate SHA512/256d PoW hash for Radiant
         pow_digest_le = radiant_pow(header80)
-        self.logger.debug(f"POW hash (LE): {pow_digest_le.hex()}")
         hnum = int.from_bytes(pow_digest_le, "little")
-        self.logger.debug(f"Hash as int: {hnum}")
+        if debug:
+            self.logger.debug(f"POW hash (LE): {pow_digest_le.hex()}")
+            self.logger.debug(f"Hash as int: {hnum}")
 
         # Check RXD target
         target_int = int(state.target, 16)
@@ -727,16 +786,12 @@ class StratumSession(RPCSession):
             )
 
             # Log rejected share asynchronously
-            import time
-
             current_timestamp = int(time.time())
-            asyncio.create_task(
-                _log_share_stats_background(
-                    worker=worker,
-                    timestamp=current_timestamp,
-                    accepted=False,
-                    difficulty=share_diff,
-                )
+            await _log_share_stats_background(
+                worker=worker,
+                timestamp=current_timestamp,
+                accepted=False,
+                difficulty=share_diff,
             )
             # Record rejected share (confidence accounting) using assigned diff
             try:
@@ -751,17 +806,15 @@ class StratumSession(RPCSession):
                 feed_manager = get_share_feed_manager()
                 self.logger.debug("Adding rejected share to feed for worker %s", worker)
                 rxd_difficulty = target_to_diff1(target_int)
-                asyncio.create_task(
-                    feed_manager.add_share(
-                        worker=worker,
-                        share_difficulty=share_diff,
-                        sent_difficulty=sent_diff,
-                        is_block=False,
-                        accepted=False,
-                        rxd_difficulty=rxd_difficulty,
-                        chain=None,
-                        miner_software=getattr(self, "_miner_software", None),
-                    )
+                await feed_manager.add_share(
+                    worker=worker,
+                    share_difficulty=share_diff,
+                    sent_difficulty=sent_diff,
+                    is_block=False,
+                    accepted=False,
+                    rxd_difficulty=rxd_difficulty,
+                    chain=None,
+                    miner_software=getattr(self, "_miner_software", None),
                 )
             except Exception as e:
                 self.logger.error("Failed to add rejected share to feed: %s", e)
@@ -788,17 +841,13 @@ class StratumSession(RPCSession):
                 self.logger.debug("Failed to record share for vardiff: %s", e)
 
         # Log share statistics asynchronously
-        import time
-
         current_timestamp = int(time.time())
 
-        asyncio.create_task(
-            _log_share_stats_background(
-                worker=worker,
-                timestamp=current_timestamp,
-                accepted=True,
-                difficulty=share_diff,
-            )
+        await _log_share_stats_background(
+            worker=worker,
+            timestamp=current_timestamp,
+            accepted=True,
+            difficulty=share_diff,
         )
 
         # Record regular shares (non-blocks) as potential best shares
@@ -830,134 +879,129 @@ class StratumSession(RPCSession):
             from ..web.share_feed import get_share_feed_manager
 
             feed_manager = get_share_feed_manager()
-            asyncio.create_task(
-                feed_manager.add_share(
-                    worker=worker,
-                    share_difficulty=share_diff,
-                    sent_difficulty=sent_diff,
-                    is_block=is_block,
-                    accepted=True,
-                    rxd_difficulty=rxd_difficulty,
-                    chain="RXD" if is_block else None,
-                    miner_software=getattr(self, "_miner_software", None),
-                )
+            await feed_manager.add_share(
+                worker=worker,
+                share_difficulty=share_diff,
+                sent_difficulty=sent_diff,
+                is_block=is_block,
+                accepted=True,
+                rxd_difficulty=rxd_difficulty,
+                chain="RXD" if is_block else None,
+                miner_software=getattr(self, "_miner_software", None),
             )
         except Exception as e:
             self.logger.debug("Failed to add share to feed: %s", e)
 
         # Submit to Radiant blockchain
         if is_block:
-            import time
-
             submit_time = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
 
             # Track submission result
             block_accepted = False
             block_height_for_notif = None
 
-            async with ClientSession() as http:
-                # Build block for submission
-                tx_count = len(state.externalTxs) + 1
-                if tx_count < 0xFD:
-                    tx_count_hex = tx_count.to_bytes(1, "little").hex()
-                elif tx_count <= 0xFFFF:
-                    tx_count_hex = "fd" + tx_count.to_bytes(2, "little").hex()
-                elif tx_count <= 0xFFFFFFFF:
-                    tx_count_hex = "fe" + tx_count.to_bytes(4, "little").hex()
-                else:
-                    tx_count_hex = "ff" + tx_count.to_bytes(8, "little").hex()
+            http = get_rpc_session()
 
-                coinbase_full = (
-                    state.coinbase1_nowit + en1 + en2 + state.coinbase2_nowit
-                )
+            # Build block for submission
+            tx_count = len(state.externalTxs) + 1
+            if tx_count < 0xFD:
+                tx_count_hex = tx_count.to_bytes(1, "little").hex()
+            elif tx_count <= 0xFFFF:
+                tx_count_hex = "fd" + tx_count.to_bytes(2, "little").hex()
+            elif tx_count <= 0xFFFFFFFF:
+                tx_count_hex = "fe" + tx_count.to_bytes(4, "little").hex()
+            else:
+                tx_count_hex = "ff" + tx_count.to_bytes(8, "little").hex()
 
-                block_hex = (
-                    header80.hex()
-                    + tx_count_hex
-                    + coinbase_full.hex()
-                    + "".join(state.externalTxs)
-                )
+            coinbase_full = (
+                state.coinbase1_nowit + en1 + en2 + state.coinbase2_nowit
+            )
 
-                from ..rpc.rxd import submitblock
-
-                state.logger.info("Submitting RXD block at height %d", state.height)
-                state.logger.debug("RXD submit block: %s", block_hex[:200] + "...")
-
-                js = await submitblock(http, self._node_url, block_hex)
-
-                if not os.path.exists("./submit_history"):
-                    os.mkdir("./submit_history")
-
-                with open(
-                    f"./submit_history/RXD_{state.height}_{state.job_counter}.txt",
-                    "w",
-                ) as f:
-                    dump = f"=== RXD BLOCK SUBMISSION ===\n"
-                    dump += f"Submission Time: {submit_time}\n"
-                    dump += f"Worker: {worker}\n"
-                    dump += f"Job ID: {job_id}\n"
-                    dump += f"Block Height: {state.height}\n"
-                    dump += f"Block Hash: {block_hash.hex()}\n"
-                    dump += f"Extranonce1: {self._extranonce1}\n"
-                    dump += f"Extranonce2: {extranonce2_hex}\n"
-                    dump += f"Ntime: {ntime_hex}\n"
-                    dump += f"Nonce: {nonce_hex}\n"
-                    dump += f"Coinbase hex: {coinbase_full.hex()}\n"
-                    dump += f"PoW Hash (SHA512/256d): {pow_digest_le.hex()}\n"
-                    dump += f"Hash Number: {hnum}\n"
-                    dump += f"Target: {target_int:064x}\n"
-                    dump += f"Share Difficulty: {share_diff:.18f}\n"
-                    dump += f"Header: {header80.hex()}\n"
-                    dump += f"Block Hex Length: {len(block_hex)} chars\n"
-                    dump += f"Transaction Count: {len(state.externalTxs) + 1}\n\n"
-                    dump += f"RPC Response:\n{json.dumps(js, indent=2)}\n\n"
-                    dump += f"Full State:\n{state.__repr__()}\n\n"
-                    dump += f"Block Hex:\n{block_hex}"
-                    f.write(dump)
-
-                if js.get("error"):
-                    self.logger.error("RXD submit error: %s", js["error"])
-                else:
-                    result = js.get("result")
-                    self.logger.info("RXD submit result: %s", result)
-
-                    # submitblock returns null on success
-                    if result is None or result == "":
-                        block_accepted = True
-                        block_height_for_notif = state.height
-                        assert block_height_for_notif is not None  # Type narrowing
-
-                        # Record as best share since block was accepted
-                        asyncio.create_task(
-                            _record_best_share_background(
-                                worker=worker,
-                                chain="RXD",
-                                block_height=state.height,
-                                share_difficulty=share_diff,
-                                target_difficulty=rxd_difficulty,
-                                timestamp=current_timestamp,
-                                miner_software=getattr(
-                                    self, "_miner_software", None
-                                ),
-                            )
-                        )
+            block_hex = (
+                header80.hex()
+                + tx_count_hex
+                + coinbase_full.hex()
+                + "".join(state.externalTxs)
+            )
 
-                # Send notifications after submission
-                if block_accepted and block_height_for_notif is not None:
-                    await self._notification_manager.notify_block_found(
-                        chain="RXD",
-                        height=block_height_for_notif,
-                        block_hash=block_hash.hex(),
-                        worker=worker,
-                        difficulty=share_diff,
-                        miner_software=getattr(self, "_miner_software", None),
+            from ..rpc.rxd import submitblock
+
+            state.logger.info("Submitting RXD block at height %d", state.height)
+            state.logger.debug("RXD submit block: %s", block_hex[:200] + "...")
+
+            js = await submitblock(http, self._node_url, block_hex)
+
+            if not os.path.exists("./submit_history"):
+                os.mkdir("./submit_history")
+
+            with open(
+                f"./submit_history/RXD_{state.height}_{state.job_counter}.txt",
+                "w",
+            ) as f:
+                dump = f"=== RXD BLOCK SUBMISSION ===\n"
+                dump += f"Submission Time: {submit_time}\n"
+                dump += f"Worker: {worker}\n"
+                dump += f"Job ID: {job_id}\n"
+                dump += f"Block Height: {state.height}\n"
+                dump += f"Block Hash: {block_hash.hex()}\n"
+                dump += f"Extranonce1: {self._extranonce1}\n"
+                dump += f"Extranonce2: {extranonce2_hex}\n"
+                dump += f"Ntime: {ntime_hex}\n"
+                dump += f"Nonce: {nonce_hex}\n"
+                dump += f"Coinbase hex: {coinbase_full.hex()}\n"
+                dump += f"PoW Hash (SHA512/256d): {pow_digest_le.hex()}\n"
+                dump += f"Hash Number: {hnum}\n"
+                dump += f"Target: {target_int:064x}\n"
+                dump += f"Share Difficulty: {share_diff:.18f}\n"
+                dump += f"Header: {header80.hex()}\n"
+                dump += f"Block Hex Length: {len(block_hex)} chars\n"
+                dump += f"Transaction Count: {len(state.externalTxs) + 1}\n\n"
+                dump += f"RPC Response:\n{json.dumps(js, indent=2)}\n\n"
+                dump += f"Full State:\n{state.__repr__()}\n\n"
+                dump += f"Block Hex:\n{block_hex}"
+                f.write(dump)
+
+            if js.get("error"):
+                self.logger.error("RXD submit error: %s", js["error"])
+            else:
+                result = js.get("result")
+                self.logger.info("RXD submit result: %s", result)
+
+                # submitblock returns null on success
+                if result is None or result == "":
+                    block_accepted = True
+                    block_height_for_notif = state.height
+                    assert block_height_for_notif is not None  # Type narrowing
+
+                    # Record as best share since block was accepted
+                    asyncio.create_task(
+                        _record_best_share_background(
+                            worker=worker,
+                            chain="RXD",
+                            block_height=state.height,
+                            share_difficulty=share_diff,
+                            target_difficulty=rxd_difficulty,
+                            timestamp=current_timestamp,
+                            miner_software=getattr(
+                                self, "_miner_software", None
+                            ),
+                        )
                     )
 
-                    # Log to database if enabled
-                    try:
-                        from ..db.schema import log_block_found
-                        import time
+            # Send notifications after submission
+            if block_accepted and block_height_for_notif is not None:
+                await self._notification_manager.notify_block_found(
+                    chain="RXD",
+                    height=block_height_for_notif,
+                    block_hash=block_hash.hex(),
+                    worker=worker,
+                    difficulty=share_diff,
+                    miner_software=getattr(self, "_miner_software", None),
+                )
 
+                # Log to database if enabled
+                if _DB_AVAILABLE:
+                    try:
                         await log_block_found(
                             chain="RXD",
                             height=block_height_for_notif,
@@ -969,42 +1013,35 @@ class StratumSession(RPCSession):
                             timestamp=int(time.time()),
                             accepted=True,
                         )
-                    except ImportError:
-                        pass  # Database not enabled
                     except Exception as e:
                         self.logger.debug("Database logging failed: %s", e)
 
-                    # Also log to in-memory tracker as fallback
-                    try:
-                        import time
-
-                        from ..web.block_tracker import get_block_tracker
+                # Also log to in-memory tracker as fallback
+                try:
+                    from ..web.block_tracker import get_block_tracker
 
-                        tracker = get_block_tracker()
-                        tracker.add_block(
-                            chain="RXD",
-                            height=block_height_for_notif,
-                            block_hash=block_hash.hex(),
-                            worker=worker,
-                            timestamp=int(time.time()),
-                            accepted=True,
-                            difficulty=share_diff,
-                        )
-                    except Exception as e:
-                        self.logger.debug("In-memory block tracking failed: %s", e)
+                    tracker = get_block_tracker()
+                    tracker.add_block(
+                        chain="RXD",
+                        height=block_height_for_notif,
+                        block_hash=block_hash.hex(),
+                        worker=worker,
+                        timestamp=int(time.time()),
+                        accepted=True,
+                        difficulty=share_diff,
+                    )
+                except Exception as e:
+                    self.logger.debug("In-memory block tracking failed: %s", e)
 
-                    # Record RXD block for confirmation tracking if DB enabled
+                # Record RXD block for confirmation tracking if DB enabled
+                if _DB_AVAILABLE:
                     try:
-                        from ..db.schema import record_block_for_confirmation
-
                         await record_block_for_confirmation(
                             chain="RXD",
                             height=block_height_for_notif,
                             block_hash=block_hash.hex(),
                             worker=worker,
                         )
-                    except ImportError:
-                        pass  # Database not enabled
                     except Exception as e:
                         self.logger.debug("Block confirmation tracking failed: %s", e)
 
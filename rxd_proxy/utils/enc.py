@@ -1,11 +1,15 @@
 from typing import Optional
 
+# Single-byte encodings for the small lengths seen in almost every coinbase
+_VI_SMALL = tuple(bytes((i,)) for i in range(0xFD))
+_OP_PUSH_SMALL = tuple(bytes((i,)) for i in range(0x4C))
+
 
 def var_int(i: int) -> bytes:
     if i < 0:
         raise ValueError(f"var_int requires non-negative integer, got {i}")
     if i < 0xFD:
-        return i.to_bytes(1, "little")
+        return _VI_SMALL[i]
     if i <= 0xFFFF:
         return b"\xfd" + i.to_bytes(2, "little")
     if i <= 0xFFFFFFFF:
@@ -14,8 +18,8 @@ def var_int(i: int) -> bytes:
 
 
 def op_push(i: int) -> bytes:
-    if i < 0x4C:
-        return i.to_bytes(1, "little")
+    if 0 <= i < 0x4C:
+        return _OP_PUSH_SMALL[i]
     elif i <= 0xFF:
         return b"\x4c" + i.to_bytes(1, "little")
     elif i <= 0xFFFF:
@@ -7,6 +7,24 @@ def dsha256(b: bytes) -> bytes:
     return sha256(sha256(b).digest()).digest()
 
 
+def dsha256_pair(a: bytes, b: bytes) -> bytes:
+    """Double SHA256 of a || b without allocating the concatenation."""
+    h = sha256(a)
+    h.update(b)
+    return sha256(h.digest()).digest()
+
+
+def sha256d_level(buf: bytes) -> list[bytes]:
+    """
+    Double SHA256 over consecutive 64-byte chunks of a contiguous buffer.
+    Used for merkle levels: buf is the concatenation of each (left, right) pair,
+    and hashlib (OpenSSL) reads the chunks through memoryview slices without copying.
+    """
+    mv = memoryview(buf)
+    _sha = sha256
+    return [_sha(_sha(mv[i : i + 64]).digest()).digest() for i in range(0, len(mv), 64)]
+
+
 def sha512_256d(b: bytes) -> bytes:
     """
     Double SHA512/256 hash - Radiant's proof-of-work algorithm.
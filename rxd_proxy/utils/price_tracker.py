@@ -141,7 +141,7 @@ class PriceTracker:
         Returns:
             Dictionary with keys: rxd_block_reward, timestamp
         """
-        from ..config import Settings
+        from ..config import get_settings
 
         current_time = time.time()
 
@@ -159,7 +159,7 @@ class PriceTracker:
             }
 
         logger.debug("Fetching block reward from RPC endpoint")
-        settings = Settings()
+        settings = get_settings()
         rxd_reward = 25000.0  # Default fallback (current block reward after first halving)
 
         try:
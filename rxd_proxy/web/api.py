@@ -222,16 +222,24 @@ async def get_active_miners():
 
 
 @app.get("/api/blocks")
-async def get_blocks(limit: int = 100, offset: int = 0):
+async def get_blocks(
+    limit: int = 100,
+    offset: int = 0,
+    cursor_timestamp: int | None = None,
+    cursor_id: int | None = None,
+):
     """Get recent blocks found with pagination support (with in-memory fallback)"""
     try:
         from ..db.schema import get_recent_blocks
 
-        result = await get_recent_blocks(limit, offset)
+        result = await get_recent_blocks(
+            limit, offset, cursor_ts=cursor_timestamp, cursor_id=cursor_id
+        )
         return JSONResponse(
             {
                 "blocks": result["blocks"],
                 "total": result["total"],
+                "next_cursor": result["next_cursor"],
                 "source": "database",
             }
         )
@@ -310,16 +318,29 @@ async def get_pending_blocks(chain: str | None = None):
 
 
 @app.get("/api/blocks/{chain}")
-async def get_chain_blocks(chain: str, limit: int = 10, offset: int = 0):
+async def get_chain_blocks(
+    chain: str,
+    limit: int = 10,
+    offset: int = 0,
+    cursor_timestamp: int | None = None,
+    cursor_id: int | None = None,
+):
     """Get recent blocks for a specific chain (RXD) with pagination"""
     try:
         from ..db.schema import get_blocks_by_chain
 
-        result = await get_blocks_by_chain(chain.upper(), limit, offset)
+        result = await get_blocks_by_chain(
+            chain.upper(),
+            limit,
+            offset,
+            cursor_ts=cursor_timestamp,
+            cursor_id=cursor_id,
+        )
         return JSONResponse(
             {
                 "blocks": result["blocks"],
                 "total": result["total"],
+                "next_cursor": result["next_cursor"],
                 "chain": chain.upper(),
                 "source": "database",
             }
@@ -418,9 +439,9 @@ async def get_stats(hours: int = 24):
         if rxd_difficulty == 0:
             try:
                 import aiohttp
-                from ..config import Settings
+                from ..config import get_settings
 
-                settings = Settings()
+                settings = get_settings()
 
                 async with aiohttp.ClientSession() as session:
                     payload = {
@@ -536,7 +557,7 @@ async def get_stats(hours: int = 24):
 async def get_payout_info():
     """Get payout address information"""
     import os
-    from ..config import Settings
+    from ..config import get_settings
 
     payout_info = {
         "rxd_address": None,
@@ -549,7 +570,7 @@ async def get_payout_info():
             # Reconstruct the address from the stored pub_h160
             import base58
 
-            settings = Settings()
+            settings = get_settings()
             version = 111 if settings.testnet else 0
             rxd_address = base58.b58encode_check(
                 bytes([version]) + state.pub_h160
@@ -605,9 +626,7 @@ async def flush_hashrate():
     """Clear in-memory hashrate tracking (5m window + EMA) for a fresh start."""
     from ..stratum.session import hashrate_tracker
 
-    cleared_workers = len(hashrate_tracker.worker_shares)
-    hashrate_tracker.worker_shares.clear()
-    hashrate_tracker.worker_ema.clear()
+    cleared_workers = hashrate_tracker.clear()
     return JSONResponse(
         {
             "status": "flushed",
@@ -621,14 +640,9 @@ async def flush_hashrate():
 async def clear_best_shares():
     """Clear all best shares from database and start fresh tracking."""
     try:
-        import aiosqlite
-        from ..db.schema import DB_PATH
+        from ..db.schema import clear_best_shares as clear_best_shares_db
 
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Delete all best shares
-            await db.execute("DELETE FROM best_shares")
-            deleted_count = db.total_changes
-            await db.commit()
+        deleted_count = await clear_best_shares_db()
 
         return JSONResponse(
             {
@@ -759,9 +773,9 @@ async def get_daemon_status():
     """Get blockchain daemon status for RXD node"""
     import aiohttp
     import asyncio
-    from ..config import Settings
+    from ..config import get_settings
 
-    settings = Settings()
+    settings = get_settings()
 
     async def get_blockchain_info(url: str, chain: str):
         """Get blockchain info from a node"""
@@ -882,8 +896,13 @@ async def get_daemon_status():
 
 
 @app.get("/api/miners/connected")
-async def get_connected_miners_paginated(page: int = 1, limit: int = 20):
-    """Get connected miners with pagination"""
+async def get_connected_miners_paginated(
+    page: int = 1,
+    limit: int = 20,
+    cursor_last_seen: int | None = None,
+    cursor_worker: str | None = None,
+):
+    """Get connected miners with pagination (page number or next_cursor values)"""
     try:
         from ..db.schema import get_connected_miners
 
@@ -891,7 +910,12 @@ async def get_connected_miners_paginated(page: int = 1, limit: int = 20):
             page = 1
         offset = (page - 1) * limit
 
-        result = await get_connected_miners(offset=offset, limit=limit)
+        result = await get_connected_miners(
+            offset=offset,
+            limit=limit,
+            cursor_last_seen=cursor_last_seen,
+            cursor_worker=cursor_worker,
+        )
         return JSONResponse(
             {
                 "miners": result["miners"],
@@ -899,6 +923,7 @@ async def get_connected_miners_paginated(page: int = 1, limit: int = 20):
                 "page": page,
                 "limit": limit,
                 "pages": (result["total"] + limit - 1) // limit,
+                "next_cursor": result["next_cursor"],
             }
         )
     except Exception as e:
@@ -910,9 +935,13 @@ async def get_connected_miners_paginated(page: int = 1, limit: int = 20):
 
 @app.get("/api/miners/disconnected")
 async def get_disconnected_miners_paginated(
-    hours: int = 24, page: int = 1, limit: int = 20
+    hours: int = 24,
+    page: int = 1,
+    limit: int = 20,
+    cursor_last_seen: int | None = None,
+    cursor_worker: str | None = None,
 ):
-    """Get recently disconnected miners with pagination"""
+    """Get recently disconnected miners with pagination (page number or next_cursor values)"""
     try:
         from ..db.schema import get_disconnected_miners
 
@@ -920,7 +949,13 @@ async def get_disconnected_miners_paginated(
             page = 1
         offset = (page - 1) * limit
 
-        result = await get_disconnected_miners(hours=hours, offset=offset, limit=limit)
+        result = await get_disconnected_miners(
+            hours=hours,
+            offset=offset,
+            limit=limit,
+            cursor_last_seen=cursor_last_seen,
+            cursor_worker=cursor_worker,
+        )
         return JSONResponse(
             {
                 "miners": result["miners"],
@@ -929,6 +964,7 @@ async def get_disconnected_miners_paginated(
                 "limit": limit,
                 "pages": (result["total"] + limit - 1) // limit,
                 "hours": hours,
+                "next_cursor": result["next_cursor"],
             }
         )
     except Exception as e:
@@ -967,7 +1003,7 @@ async def get_earnings_estimate():
         from ..utils.earnings import EarningsCalculator
         from ..utils.price_tracker import get_price_tracker
         from ..consensus.targets import target_to_diff1
-        from ..config import Settings
+        from ..config import get_settings
         import aiohttp
 
         if not state:
@@ -1001,7 +1037,7 @@ async def get_earnings_estimate():
 
         if rxd_difficulty == 0.0:
             try:
-                settings = Settings()
+                settings = get_settings()
                 async with aiohttp.ClientSession() as session:
                     payload = {
                         "jsonrpc": "1.0",
@@ -1149,8 +1185,7 @@ async def get_earnings_estimate():
         # Calculate actual earnings from blocks found (dynamic date range)
         if db_enabled:
             try:
-                from ..db.schema import get_stats_summary, DB_PATH
-                import aiosqlite
+                from ..db.schema import get_stats_summary, get_block_time_span
 
                 # Get 7-day block data first
                 stats_7d = await get_stats_summary(hours=168)  # 7 days = 168 hours
@@ -1160,19 +1195,15 @@ async def get_earnings_estimate():
                 # Query database directly to find actual date range of blocks
                 actual_days = 1
                 try:
-                    async with aiosqlite.connect(DB_PATH) as db:
-                        # Get oldest and newest block timestamps
-                        cursor = await db.execute(
-                            "SELECT MIN(timestamp) as oldest, MAX(timestamp) as newest FROM blocks"
-                        )
-                        row = await cursor.fetchone()
-
-                        if row and row[0] and row[1]:
-                            # Calculate actual days in database
-                            time_span_seconds = row[1] - row[0]
-                            actual_days = max(
-                                1, time_span_seconds / 86400
-                            )  # at least 1 day
+                    # Get oldest and newest block timestamps
+                    oldest, newest = await get_block_time_span()
+
+                    if oldest and newest:
+                        # Calculate actual days in database
+                        time_span_seconds = newest - oldest
+                        actual_days = max(
+                            1, time_span_seconds / 86400
+                        )  # at least 1 day
                 except Exception as e:
                     logger.debug(f"Could not determine block date range: {e}")
                     actual_days = 1
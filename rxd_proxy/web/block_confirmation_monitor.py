@@ -1,6 +1,6 @@
 """
 Block Confirmation Monitor - Periodic task for checking block confirmations and detecting orphans.
-Runs every 5 minutes to poll blockchain for confirmation status.
+Runs on every new block (when ZMQ is enabled) and at least every 5 minutes.
 """
 
 import asyncio
@@ -30,6 +30,7 @@ class BlockConfirmationMonitor:
         self.node_url = None
         self.notification_manager = None
         self.seeding_complete = False  # Track if initial seeding is done
+        self._new_block = asyncio.Event()  # Set by ZMQ when the chain tip moves
 
     def set_rpc_url(self, rxd_url: str):
         """Set RPC URL for Radiant node"""
@@ -39,6 +40,18 @@ class BlockConfirmationMonitor:
         """Set notification manager for alerts"""
         self.notification_manager = notification_manager
 
+    def notify_new_block(self):
+        """Wake the loop for a check now (confirmations only change on new blocks)"""
+        self._new_block.set()
+
+    async def _wait_for_next_check(self):
+        """Sleep until a new block arrives or the check interval elapses"""
+        try:
+            await asyncio.wait_for(self._new_block.wait(), timeout=self.check_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._new_block.clear()
+
     async def get_block_confirmations(self, block_hash: str) -> tuple[int, bool]:
         """
         Query Radiant blockchain for block confirmations.
@@ -49,38 +62,37 @@ class BlockConfirmationMonitor:
                 logger.warning("RXD RPC URL not configured")
                 return (0, False)
 
-            from aiohttp import ClientSession
+            from ..rpc.rxd import get_rpc_session, getblock
 
-            async with ClientSession() as session:
-                from ..rpc.rxd import getblock
+            session = get_rpc_session()
 
-                try:
-                    response = await getblock(session, self.node_url, block_hash)
+            try:
+                response = await getblock(session, self.node_url, block_hash)
 
-                    # JSON-RPC response is wrapped in "result" field
-                    if not response or "error" in response or response.get("error"):
-                        logger.debug(f"RXD getblock error: {response}")
-                        # If block not found, it's been orphaned
-                        return (0, True)
+                # JSON-RPC response is wrapped in "result" field
+                if not response or "error" in response or response.get("error"):
+                    logger.debug(f"RXD getblock error: {response}")
+                    # If block not found, it's been orphaned
+                    return (0, True)
 
-                    # Extract the actual block data from the result field
-                    result = response.get("result", {})
-                    if not result:
-                        logger.debug(f"RXD getblock returned empty result: {response}")
-                        return (0, True)
+                # Extract the actual block data from the result field
+                result = response.get("result", {})
+                if not result:
+                    logger.debug(f"RXD getblock returned empty result: {response}")
+                    return (0, True)
 
-                    # Block found - check confirmation count
-                    confirmations = result.get("confirmations", 0)
+                # Block found - check confirmation count
+                confirmations = result.get("confirmations", 0)
 
-                    # Block is orphaned if confirmations is 0 or negative
-                    # (confirmations > 0 means it's in the main chain)
-                    is_orphaned = confirmations <= 0
+                # Block is orphaned if confirmations is 0 or negative
+                # (confirmations > 0 means it's in the main chain)
+                is_orphaned = confirmations <= 0
 
-                    return (confirmations, is_orphaned)
+                return (confirmations, is_orphaned)
 
-                except Exception as e:
-                    logger.error(f"RXD confirmation check failed: {e}")
-                    return (0, False)
+            except Exception as e:
+                logger.error(f"RXD confirmation check failed: {e}")
+                return (0, False)
 
         except Exception as e:
             logger.error(f"RXD RPC error: {e}")
@@ -88,10 +100,7 @@ class BlockConfirmationMonitor:
 
     async def check_confirmations_loop(self):
         """Main confirmation checking loop - runs every 5 minutes"""
-        from ..db.schema import (
-            get_pending_blocks,
-            check_block_confirmations,
-        )
+        from ..db.schema import check_block_confirmations
 
         logger.info(
             f"Starting block confirmation monitor (checking every {self.check_interval}s)"
@@ -99,13 +108,8 @@ class BlockConfirmationMonitor:
 
         while self.running:
             try:
-                # Get all pending blocks
-                pending_rxd = await get_pending_blocks("RXD")
-
-                if pending_rxd and self.node_url:
-                    logger.info(
-                        f"Checking confirmations for {len(pending_rxd)} RXD blocks"
-                    )
+                # Pending blocks are read (and queried concurrently) by check_block_confirmations
+                if self.node_url:
                     await check_block_confirmations(
                         "RXD",
                         self.get_block_confirmations,
@@ -114,8 +118,8 @@ class BlockConfirmationMonitor:
                         skip_notifications=not self.seeding_complete,
                     )
 
-                # Wait for next check interval
-                await asyncio.sleep(self.check_interval)
+                # Wait for the next block or check interval
+                await self._wait_for_next_check()
 
             except asyncio.CancelledError:
                 break
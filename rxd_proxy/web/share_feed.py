@@ -9,6 +9,13 @@ import asyncio
 from collections import deque
 from typing import Optional, List, Dict, Any
 
+try:
+    from ..db.schema import database_ready, get_share_totals, get_shares, log_share
+
+    _DB_AVAILABLE = True
+except ImportError:  # database support not installed
+    _DB_AVAILABLE = False
+
 
 class ShareFeedManager:
     """
@@ -92,8 +99,9 @@ class ShareFeedManager:
         if self.connected_clients:
             asyncio.create_task(self._broadcast(share))
 
-        # Store to database asynchronously (non-blocking)
-        asyncio.create_task(self._store_share_to_db(share))
+        # Queue for the database's batched writer; this never suspends, so it
+        # runs inline instead of costing a Task per share
+        await self._store_share_to_db(share)
 
         return share
 
@@ -135,42 +143,28 @@ class ShareFeedManager:
                 pass
 
     async def _store_share_to_db(self, share: Dict[str, Any]) -> None:
-        """Store a share to the database asynchronously (non-blocking).
+        """Queue a share for the database's batched writer (non-blocking).
 
-        This runs in the background and doesn't block share processing.
+        This only enqueues the row, so it doesn't block share processing.
         If database is disabled or fails, the share still stays in memory and broadcasts.
         """
+        if not (_DB_AVAILABLE and database_ready()):
+            # Database not enabled, silently skip
+            return
+
         try:
-            import aiosqlite
-            from pathlib import Path
-
-            db_path = Path("data/mining.db")
-            if not db_path.exists():
-                # Database not enabled, silently skip
-                return
-
-            async with aiosqlite.connect(str(db_path)) as db:
-                await db.execute(
-                    """
-                    INSERT INTO shares (
-                        worker, share_difficulty, sent_difficulty, difficulty_ratio,
-                        is_block, accepted, rxd_difficulty, chain, miner_software, timestamp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        share["worker"],
-                        share["share_difficulty"],
-                        share["sent_difficulty"],
-                        share["difficulty_ratio"],
-                        share["is_block"],
-                        share["accepted"],
-                        share["rxd_difficulty"],
-                        share.get("chain", "RXD"),
-                        share.get("miner_software", "Unknown"),
-                        share["timestamp"],
-                    ),
-                )
-                await db.commit()
+            await log_share(
+                share["worker"],
+                share["share_difficulty"],
+                share["sent_difficulty"],
+                share["difficulty_ratio"],
+                share["is_block"],
+                share["accepted"],
+                share["rxd_difficulty"],
+                share.get("chain", "RXD"),
+                share.get("miner_software", "Unknown"),
+                share["timestamp"],
+            )
         except Exception as e:
             # Silently fail - database storage is non-critical
             # The share is still in memory and broadcasts to WebSocket clients
@@ -202,74 +196,20 @@ class ShareFeedManager:
         """
         # Try to load from database first if available
         try:
-            import aiosqlite
-            from pathlib import Path
-
-            db_path = Path("data/mining.db")
-            if db_path.exists():
-                async with aiosqlite.connect(str(db_path)) as db:
-                    # Build query for shares table
-                    query = "SELECT * FROM shares WHERE 1=1"
-                    params = []
-
-                    if worker:
-                        query += " AND worker = ?"
-                        params.append(worker)
-                    if accepted_only:
-                        query += " AND accepted = 1"
-                    if blocks_only:
-                        query += " AND is_block = 1"
-
-                    # Order by timestamp descending (newest first)
-                    query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-                    params.extend([limit, offset])
-
-                    async with db.execute(query, params) as cursor:
-                        rows = await cursor.fetchall()
-
-                        # Count total matching records
-                        count_query = "SELECT COUNT(*) FROM shares WHERE 1=1"
-                        count_params = []
-                        if worker:
-                            count_query += " AND worker = ?"
-                            count_params.append(worker)
-                        if accepted_only:
-                            count_query += " AND accepted = 1"
-                        if blocks_only:
-                            count_query += " AND is_block = 1"
-
-                        async with db.execute(
-                            count_query, count_params
-                        ) as count_cursor:
-                            count_row = await count_cursor.fetchone()
-                            total = count_row[0] if count_row else 0
-
-                        # Convert rows to share dicts (if table exists and has data)
-                        if rows:
-                            shares = []
-                            for row in rows:
-                                share = {
-                                    "id": row[0],
-                                    "worker": row[1],
-                                    "share_difficulty": row[2],
-                                    "sent_difficulty": row[3],
-                                    "difficulty_ratio": row[4],
-                                    "is_block": row[5],
-                                    "accepted": row[6],
-                                    "rxd_difficulty": row[7],
-                                    "chain": row[8],
-                                    "miner_software": row[9],
-                                    "timestamp": row[10],
-                                }
-                                shares.append(share)
-
-                            return {
-                                "shares": shares,
-                                "total": total,
-                                "limit": limit,
-                                "offset": offset,
-                                "source": "database",
-                            }
+            if _DB_AVAILABLE and database_ready():
+                page = await get_shares(
+                    limit, offset, worker, accepted_only, blocks_only
+                )
+
+                # Use the database rows if the table has data
+                if page["shares"]:
+                    return {
+                        "shares": page["shares"],
+                        "total": page["total"],
+                        "limit": limit,
+                        "offset": offset,
+                        "source": "database",
+                    }
         except Exception:
             # If database query fails, fall back to in-memory buffer
             pass
@@ -322,28 +262,15 @@ class ShareFeedManager:
         buffer if database is not available.
         """
         try:
-            import aiosqlite
-            from pathlib import Path
-
-            db_path = Path("data/mining.db")
-            if db_path.exists():
-                async with aiosqlite.connect(str(db_path)) as db:
-                    # Query all-time statistics from database
-                    async with db.execute(
-                        "SELECT COUNT(*), SUM(CASE WHEN accepted=1 THEN 1 ELSE 0 END), "
-                        "SUM(CASE WHEN accepted=0 THEN 1 ELSE 0 END), "
-                        "SUM(CASE WHEN is_block=1 THEN 1 ELSE 0 END) FROM shares"
-                    ) as cursor:
-                        row = await cursor.fetchone()
-                        if row and row[0] > 0:
-                            return {
-                                "total_shares": row[0] or 0,
-                                "accepted_shares": row[1] or 0,
-                                "rejected_shares": row[2] or 0,
-                                "blocks": row[3] or 0,
-                                "connected_clients": len(self.connected_clients),
-                                "source": "database",
-                            }
+            if _DB_AVAILABLE and database_ready():
+                # Query all-time statistics from database
+                totals = await get_share_totals()
+                if totals["total_shares"] > 0:
+                    return {
+                        **totals,
+                        "connected_clients": len(self.connected_clients),
+                        "source": "database",
+                    }
         except Exception:
             # Fall back to in-memory buffer if database query fails
             pass